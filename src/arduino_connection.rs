@@ -102,6 +102,18 @@ impl ArduinoConnectionManager {
         self.connect()
     }
     
+    /// Check if an I/O error indicates connection loss. Matches on the error
+    /// kind so the hot read/write paths never format the error into a string.
+    fn is_connection_io_error(err: &std::io::Error) -> bool {
+        matches!(
+            err.kind(),
+            std::io::ErrorKind::BrokenPipe
+                | std::io::ErrorKind::ConnectionReset
+                | std::io::ErrorKind::NotFound
+                | std::io::ErrorKind::PermissionDenied
+        )
+    }
+
     /// Check if an error indicates connection loss
     fn is_connection_error(err: &anyhow::Error) -> bool {
         let err_str = format!("{:#}", err);
@@ -175,7 +187,7 @@ impl ArduinoConnectionManager {
                         match p.flush() {
                             Ok(_) => Ok(()),
                             Err(e) => {
-                                if Self::is_connection_error(&anyhow!(e)) {
+                                if Self::is_connection_io_error(&e) {
                                     self.disconnect();
                                 }
                                 Err(anyhow!("Flush error: {}", e))
@@ -183,7 +195,7 @@ impl ArduinoConnectionManager {
                         }
                     }
                     Err(e) => {
-                        if Self::is_connection_error(&anyhow!(e)) {
+                        if Self::is_connection_io_error(&e) {
                             self.disconnect();
                         }
                         Err(anyhow!("Write error: {}", e))
@@ -282,7 +294,7 @@ impl ArduinoConnectionManager {
                 match port.flush() {
                     Ok(_) => {}
                     Err(e) => {
-                        if Self::is_connection_error(&anyhow!(e)) {
+                        if Self::is_connection_io_error(&e) {
                             self.disconnect();
                         }
                         return Err(anyhow!("Flush error: {}", e));
@@ -290,7 +302,7 @@ impl ArduinoConnectionManager {
                 }
             }
             Err(e) => {
-                if Self::is_connection_error(&anyhow!(e)) {
+                if Self::is_connection_io_error(&e) {
                     self.disconnect();
                 }
                 return Err(anyhow!("Write error: {}", e));
@@ -300,13 +312,13 @@ impl ArduinoConnectionManager {
         // Wait for Arduino to send positions
         std::thread::sleep(Duration::from_millis(50));
         
-        // Read response
-        let mut buffer = Vec::new();
+        // Read response (pre-sized buffers so the poll loop never allocates)
+        let mut buffer = Vec::with_capacity(256);
+        let mut chunk = [0u8; 256];
         let start_time = std::time::Instant::now();
         let timeout = Duration::from_secs(2);
-        
+
         while start_time.elapsed() < timeout {
-            let mut chunk = vec![0u8; 256];
             match port.read(&mut chunk) {
                 Ok(bytes_read) if bytes_read > 0 => {
                     buffer.extend_from_slice(&chunk[..bytes_read]);
@@ -318,13 +330,12 @@ impl ArduinoConnectionManager {
                     std::thread::sleep(Duration::from_millis(10));
                 }
                 Err(e) => {
-                    let err_str = e.to_string();
-                    if err_str.contains("timeout") || err_str.contains("TimedOut") {
+                    if e.kind() == std::io::ErrorKind::TimedOut {
                         std::thread::sleep(Duration::from_millis(10));
                         continue;
                     }
                     // Connection error - mark as disconnected
-                    if Self::is_connection_error(&anyhow!(&err_str)) {
+                    if Self::is_connection_io_error(&e) {
                         self.disconnect();
                     }
                     return Err(anyhow!("Read error: {}", e));
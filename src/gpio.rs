@@ -14,7 +14,7 @@ use std::collections::HashMap;
 #[cfg(feature = "gpiod")]
 use gpiocdev::chip::Chip;
 #[cfg(feature = "gpiod")]
-use gpiocdev::line::{Bias, Value};
+use gpiocdev::line::{Bias, Value, Values};
 #[cfg(feature = "gpiod")]
 use gpiocdev::request::Request;
 
@@ -34,6 +34,11 @@ pub struct GpioBoard {
     // Individual line requests (for gpiod)
     #[cfg(feature = "gpiod")]
     line_requests: HashMap<u32, Request>,
+
+    // Single bulk request covering all Z-touch lines, so a full press_check
+    // is one kernel call instead of one per pin
+    #[cfg(feature = "gpiod")]
+    z_touch_request: Option<Request>,
     
     // Encoder tracking (software-based since we don't have hardware encoder support yet)
     encoder_steps: i32,
@@ -99,6 +104,8 @@ impl GpioBoard {
             x_limit_button: None,
             #[cfg(feature = "gpiod")]
             line_requests: HashMap::new(),
+            #[cfg(feature = "gpiod")]
+            z_touch_request: None,
             encoder_steps: 0,
             distance_sensor_enabled: false,
             last_good_distance: 0,
@@ -156,10 +163,31 @@ impl GpioBoard {
             (x_home_line, x_away_line, None)
         };
         
-        // Request each line individually using the correct gpiocdev API
+        // Request all Z-touch lines as one bulk request (one ioctl reads
+        // every sensor); X limit lines are still requested individually.
+        // Falling-edge detection lets callers block on contact (the lines
+        // are pulled up and go low on touch) instead of busy-polling.
+        let z_touch_request = if z_touch_pins.is_empty() {
+            None
+        } else {
+            Some(
+                Request::builder()
+                    .on_chip(&chip_path)
+                    .with_consumer("StringDriver")
+                    .with_lines(&z_touch_pins)
+                    .as_input()
+                    .with_bias(Bias::PullUp)
+                    .with_edge_detection(gpiocdev::line::EdgeDetection::FallingEdge)
+                    .request()?,
+            )
+        };
+
         let mut line_requests = HashMap::new();
-        
+
         for offset in &all_pins {
+            if z_touch_pins.contains(offset) {
+                continue; // Covered by the bulk Z-touch request
+            }
             let request = Request::builder()
                 .on_chip(&chip_path)
                 .with_consumer("StringDriver")
@@ -167,7 +195,7 @@ impl GpioBoard {
                 .as_input()
                 .with_bias(Bias::PullUp)
                 .request()?;
-            
+
             line_requests.insert(*offset, request);
         }
         
@@ -184,6 +212,7 @@ impl GpioBoard {
             x_away_line,
             x_limit_button,
             line_requests,
+            z_touch_request,
             encoder_steps: 0,
             distance_sensor_enabled,
             last_good_distance: 0,
@@ -276,35 +305,27 @@ impl GpioBoard {
         
         #[cfg(feature = "gpiod")]
         {
-            if let Some(ref z_pins) = self.z_touch_lines {
+            if let (Some(z_pins), Some(request)) = (&self.z_touch_lines, &self.z_touch_request) {
                 let mut results = Vec::new();
-                
+
                 if let Some(idx) = button_index {
                     if idx < z_pins.len() {
                         let pin = z_pins[idx];
-                        if let Some(request) = self.line_requests.get(&pin) {
-                            // Touch is TRUE when line is LOW (INACTIVE) - pulled up, active low
-                            let value = request.value(pin)?;
-                            results.push(value == Value::Inactive);
-                        } else {
-                            results.push(false);
-                        }
+                        // Touch is TRUE when line is LOW (INACTIVE) - pulled up, active low
+                        let value = request.value(pin)?;
+                        results.push(value == Value::Inactive);
                     } else {
                         results.push(false);
                     }
                 } else {
-                    // Return all Z-touch states
+                    // Return all Z-touch states with a single bulk read
+                    let mut values = Values::from_offsets(z_pins);
+                    request.values(&mut values)?;
                     for pin in z_pins {
-                        if let Some(request) = self.line_requests.get(pin) {
-                            let value = request.value(*pin)?;
-                            let is_touching = value == Value::Inactive;
-                            results.push(is_touching);
-                        } else {
-                            results.push(false);
-                        }
+                        results.push(values.get(*pin) == Some(Value::Inactive));
                     }
                 }
-                
+
                 Ok(results)
             } else {
                 Ok(vec![false; self.num_touch_pins])
@@ -317,6 +338,42 @@ impl GpioBoard {
         }
     }
     
+    /// Wait for a falling edge (contact) on any Z-touch line, up to `timeout`.
+    /// Returns true if an edge fired. This only replaces dead settle time
+    /// with an early wake - callers still confirm actual line states via
+    /// press_check. Falls back to a plain sleep when events are unavailable.
+    pub fn wait_z_touch(&self, timeout: std::time::Duration) -> bool {
+        if !self.exist {
+            std::thread::sleep(timeout);
+            return false;
+        }
+
+        #[cfg(feature = "gpiod")]
+        {
+            if let Some(request) = &self.z_touch_request {
+                match request.wait_edge_event(timeout) {
+                    Ok(true) => {
+                        // Drain queued events; levels are re-read via press_check
+                        while request.has_edge_event().unwrap_or(false) {
+                            if request.read_edge_event().is_err() {
+                                break;
+                            }
+                        }
+                        return true;
+                    }
+                    Ok(false) => return false,
+                    Err(_) => {
+                        std::thread::sleep(timeout);
+                        return false;
+                    }
+                }
+            }
+        }
+
+        std::thread::sleep(timeout);
+        false
+    }
+
     /// Check the X home limit switch
     pub fn x_home_check(&self) -> Result<bool> {
         if !self.exist {
@@ -392,6 +449,7 @@ impl GpioBoard {
         {
             // Requests are automatically released when dropped
             self.line_requests.clear();
+            self.z_touch_request = None;
         }
         
         println!("GPIO resources released.");
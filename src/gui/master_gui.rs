@@ -51,17 +51,59 @@ pub struct MasterGUI {
 
 impl MasterGUI {
     /// Check if audmon process is running
+    ///
+    /// Result is cached for 5s so repeated calls don't pay a process probe
+    /// each time. On Linux the probe scans /proc/<pid>/cmdline directly
+    /// (no fork/exec); other platforms fall back to pgrep.
     fn check_audmon_process() -> bool {
-        use std::process::Command;
-        // Check for audio_monitor process
-        let output = Command::new("pgrep")
-            .arg("-f")
-            .arg("target/release/audio_monitor")
-            .output();
-        
-        match output {
-            Ok(output) => output.status.success(),
-            Err(_) => false,
+        static AUDMON_CHECK_CACHE: Mutex<Option<(Instant, bool)>> = Mutex::new(None);
+        const CHECK_TTL: Duration = Duration::from_secs(5);
+
+        if let Ok(cache) = AUDMON_CHECK_CACHE.lock() {
+            if let Some((checked_at, running)) = *cache {
+                if checked_at.elapsed() < CHECK_TTL {
+                    return running;
+                }
+            }
+        }
+
+        let running = Self::probe_audmon_process();
+
+        if let Ok(mut cache) = AUDMON_CHECK_CACHE.lock() {
+            *cache = Some((Instant::now(), running));
+        }
+        running
+    }
+
+    /// Uncached process probe backing check_audmon_process()
+    fn probe_audmon_process() -> bool {
+        if cfg!(target_os = "linux") {
+            // Scan /proc directly instead of shelling out to pgrep
+            if let Ok(entries) = std::fs::read_dir("/proc") {
+                for entry in entries.flatten() {
+                    let name = entry.file_name();
+                    let Some(pid) = name.to_str().filter(|s| s.chars().all(|c| c.is_ascii_digit())) else {
+                        continue;
+                    };
+                    let cmdline_path = format!("/proc/{}/cmdline", pid);
+                    if let Ok(cmdline) = std::fs::read_to_string(&cmdline_path) {
+                        if cmdline.contains("target/release/audio_monitor") {
+                            return true;
+                        }
+                    }
+                }
+            }
+            false
+        } else {
+            use std::process::Command;
+            let output = Command::new("pgrep")
+                .arg("-f")
+                .arg("target/release/audio_monitor")
+                .output();
+            match output {
+                Ok(output) => output.status.success(),
+                Err(_) => false,
+            }
         }
     }
     
@@ -251,7 +293,7 @@ impl eframe::App for MasterGUI {
                         ctx.send_viewport_cmd(egui::ViewportCommand::Close);
                         return;
                     }
-                    ctx.request_repaint_after(Duration::from_millis(16));
+                    // Repaint cadence already requested once at the top of update()
                     ops.poll_operation_result();
                     let partials = get_results::read_partials_from_slot(&ops.partials_slot);
                     ops.operations.read().unwrap().update_audio_analysis_with_partials(partials);
@@ -20,6 +20,7 @@ use std::sync::{Arc, Mutex, RwLock, atomic::{AtomicBool, AtomicUsize}};
 use std::sync::mpsc::{self, Receiver, TryRecvError};
 use std::thread;
 use std::time::{Duration, Instant};
+use std::io::{BufRead, BufReader, Write};
 use std::os::unix::net::UnixStream;
 use std::process::Command;
 use uuid::Uuid;
@@ -83,11 +84,10 @@ impl ArduinoStepperOps {
     }
     /// Send a text command to stepper_gui via Unix socket
     fn send_command(&mut self, cmd: &str) -> Result<()> {
-        use std::io::Write;
-        
         let cmd_with_newline = format!("{}
 ", cmd);
-        println!("Stepper IPC command: {}", cmd);
+        // debug! is level-gated: no formatting cost per command unless enabled
+        log::debug!(target: "stepper_ipc", "Stepper IPC command: {}", cmd);
         match self.ensure_stream() {
             Ok(stream) => {
                 if let Err(e) = stream.write_all(cmd_with_newline.as_bytes()) {
@@ -121,9 +121,6 @@ impl ArduinoStepperOps {
     }
 
     fn fetch_x_step_from_socket(socket_path: &str) -> Result<i32> {
-        use std::io::{BufRead, BufReader, Write};
-        use std::os::unix::net::UnixStream;
-
         let mut stream = UnixStream::connect(socket_path)
             .map_err(|e| anyhow::anyhow!("Failed to connect to stepper_gui socket at {}: {}", socket_path, e))?;
         stream
@@ -146,9 +143,6 @@ impl ArduinoStepperOps {
     }
 
     fn fetch_positions_from_socket(socket_path: &str) -> Result<Vec<i32>> {
-        use std::io::{BufRead, BufReader, Write};
-        use std::os::unix::net::UnixStream;
-
         let mut stream = UnixStream::connect(socket_path)
             .map_err(|e| anyhow::anyhow!("Failed to connect to stepper_gui socket at {}: {}", socket_path, e))?;
         stream
@@ -173,8 +167,9 @@ impl ArduinoStepperOps {
         let mut tokens = response.trim().split_whitespace();
         match tokens.next() {
             Some("positions") => {
-                let mut entries: Vec<(usize, i32)> = Vec::new();
-                let mut max_idx: Option<usize> = None;
+                // Single pass: grow the result in place instead of buffering
+                // every token into an intermediate Vec and re-walking it.
+                let mut positions: Vec<i32> = vec![0];
                 for token in tokens {
                     if token.is_empty() {
                         continue;
@@ -188,21 +183,10 @@ impl ArduinoStepperOps {
                     let value = val_str
                         .parse::<i32>()
                         .map_err(|e| anyhow::anyhow!("Invalid stepper value '{}': {}", val_str, e))?;
-                    if let Some(current_max) = max_idx {
-                        if idx > current_max {
-                            max_idx = Some(idx);
-                        }
-                    } else {
-                        max_idx = Some(idx);
-                    }
-                    entries.push((idx, value));
-                }
-                let max_idx = max_idx.unwrap_or(0);
-                let mut positions = vec![0i32; max_idx + 1];
-                for (idx, value) in entries {
-                    if idx < positions.len() {
-                        positions[idx] = value;
+                    if idx >= positions.len() {
+                        positions.resize(idx + 1, 0);
                     }
+                    positions[idx] = value;
                 }
                 Ok(positions)
             }
@@ -248,7 +232,8 @@ pub struct OperationsGUI {
     amp_sum_min: Vec<i32>,      // Per-channel minimum amplitude sum
     amp_sum_max: Vec<i32>,      // Per-channel maximum amplitude sum
     // Track stepper positions locally (updated as we move steppers)
-    stepper_positions: Arc<Mutex<std::collections::HashMap<usize, i32>>>,
+    // Dense array indexed by stepper index - grown on demand
+    stepper_positions: Arc<Mutex<Vec<i32>>>,
     // Exit flag to signal operations to stop
     pub exit_flag: Arc<AtomicBool>,
     // Operation lock to prevent concurrent execution
@@ -343,12 +328,12 @@ impl OperationsGUI {
         let voice_count_max = vec![voice_count_cap; initial_channel_count];
         let amp_sum_min = vec![20; initial_channel_count];
         let amp_sum_max = vec![250; initial_channel_count];
-        let stepper_positions: Arc<Mutex<std::collections::HashMap<usize, i32>>> = Arc::new(Mutex::new(std::collections::HashMap::new()));
+        let stepper_positions: Arc<Mutex<Vec<i32>>> = Arc::new(Mutex::new(Vec::new()));
         {
             let enabled_snapshot = operations.read().unwrap().get_all_stepper_enabled();
-            if let Ok(mut map) = stepper_positions.lock() {
-                for idx in enabled_snapshot.keys() {
-                    map.entry(*idx).or_insert(0);
+            if let Ok(mut cached) = stepper_positions.lock() {
+                if let Some(max_idx) = enabled_snapshot.keys().max() {
+                    cached.resize(max_idx + 1, 0);
                 }
             }
         }
@@ -398,7 +383,6 @@ impl OperationsGUI {
                 None
             };
             thread::spawn(move || {
-                use std::time::Instant;
                 let mut last_log = Instant::now();
                 const LOG_INTERVAL: Duration = Duration::from_secs(1); // 1Hz
                 loop {
@@ -419,21 +403,22 @@ impl OperationsGUI {
                                                 all_positions[idx] = pos;
                                             }
                                         }
-                                        // Update cached map for other uses
-                                        if let Ok(mut map) = stepper_positions_clone.lock() {
-                                            for (idx, &pos) in fresh_positions.iter().enumerate() {
-                                                map.insert(idx, pos);
+                                        // Update cached array for other uses
+                                        if let Ok(mut cached) = stepper_positions_clone.lock() {
+                                            if cached.len() < fresh_positions.len() {
+                                                cached.resize(fresh_positions.len(), 0);
                                             }
+                                            cached[..fresh_positions.len()].copy_from_slice(&fresh_positions);
                                         }
                                     }
                                 }
                             }
                             
                             // Fallback to cached positions if socket fetch failed
-                            if let Ok(positions_map) = stepper_positions_clone.lock() {
-                                for (idx, &pos) in positions_map.iter() {
-                                    if *idx < all_positions.len() && all_positions[*idx] == 0 {
-                                        all_positions[*idx] = pos;
+                            if let Ok(cached) = stepper_positions_clone.lock() {
+                                for (idx, &pos) in cached.iter().enumerate() {
+                                    if idx < all_positions.len() && all_positions[idx] == 0 {
+                                        all_positions[idx] = pos;
                                     }
                                 }
                             }
@@ -474,7 +459,7 @@ impl OperationsGUI {
                                     voice_count_max: vc_max.clone(),
                                     amp_sum_min: amp_min.clone(),
                                     amp_sum_max: amp_max.clone(),
-                                    stepper_roles: (*stepper_roles_clone_for_logger).clone(),
+                                    stepper_roles: Arc::clone(&stepper_roles_clone_for_logger),
                                 };
                                 logger_clone.insert_machine_state(&snapshot);
                             }
@@ -485,10 +470,17 @@ impl OperationsGUI {
             });
         }
         
+        let exit_flag = Arc::new(AtomicBool::new(false));
+        // Register the flag with Operations so rest sleeps inside long
+        // operations are cut short by Stop instead of running to completion
+        if let Ok(ops_guard) = operations.read() {
+            ops_guard.set_exit_flag(Arc::clone(&exit_flag));
+        }
+
         Ok(Self {
             operations,
             message: String::new(),
-            exit_flag: Arc::new(AtomicBool::new(false)),
+            exit_flag,
             operation_running: Arc::new(AtomicBool::new(false)),
             operation_task: None,
             partials_slot,
@@ -518,6 +510,33 @@ impl OperationsGUI {
         self.message.push_str(msg);
     }
     
+    /// Draw one stepper enable checkbox (plus optional bump indicator dot)
+    /// and forward toggles to Operations. Shared by the X, tuner and Z
+    /// sections so the toggle handling lives in one place.
+    fn stepper_enable_checkbox(
+        &mut self,
+        ui: &mut egui::Ui,
+        idx: usize,
+        label: &str,
+        enabled_map: &std::collections::HashMap<usize, bool>,
+        bump_dot: Option<bool>,
+    ) {
+        let mut enabled = enabled_map.get(&idx).copied().unwrap_or(false);
+        if ui.checkbox(&mut enabled, label).changed() {
+            self.operations.read().unwrap().set_stepper_enabled(idx, enabled);
+            self.append_message(&format!("Stepper {} {}", idx, if enabled { "enabled" } else { "disabled" }));
+        }
+        if let Some(is_bumping) = bump_dot {
+            let dot_color = if is_bumping {
+                egui::Color32::from_rgb(220, 0, 0)
+            } else {
+                egui::Color32::from_gray(120)
+            };
+            let (rect, _) = ui.allocate_exact_size(egui::Vec2::new(14.0, 14.0), egui::Sense::hover());
+            ui.painter().circle_filled(rect.center(), 5.0, dot_color);
+        }
+    }
+
     fn sync_voice_threshold_caps(&mut self, new_cap: i32) {
         let cap = std::cmp::max(1, new_cap);
         for max_val in self.voice_count_max.iter_mut() {
@@ -570,39 +589,59 @@ impl OperationsGUI {
     pub fn poll_operation_result(&mut self) {
         let mut should_clear = false;
         let mut schedule_repeat_op: Option<String> = None;
+        // Drain every queued result and collect the text, so a burst of
+        // progress messages costs one append (and one repaint of the log)
+        // per frame instead of trickling out one message per frame.
+        let mut batched_messages = String::new();
         if let Some(task) = self.operation_task.as_mut() {
-            match task.receiver.try_recv() {
-                Ok(result) => {
-                    for (idx, pos) in result.updated_positions {
+            loop {
+                match task.receiver.try_recv() {
+                    Ok(result) => {
                         if let Ok(mut positions) = self.stepper_positions.lock() {
-                            positions.insert(idx, pos);
+                            for (idx, pos) in result.updated_positions {
+                                if idx >= positions.len() {
+                                    positions.resize(idx + 1, 0);
+                                }
+                                positions[idx] = pos;
+                            }
+                        }
+                        if !batched_messages.is_empty() {
+                            batched_messages.push('\n');
+                        }
+                        batched_messages.push_str(&result.message);
+
+                        // If this is a progress message, just append it and continue
+                        // If it's the final result, mark operation as complete
+                        if !result.is_progress {
+                            self.operation_running.store(false, std::sync::atomic::Ordering::Relaxed);
+                            // Reset exit flag when operation completes (unless it's a kill_all shutdown)
+                            // This allows break button to work without closing the window
+                            self.exit_flag.store(false, std::sync::atomic::Ordering::Relaxed);
+                            should_clear = true;
+                            if self.repeat_enabled && self.selected_operation == result.operation {
+                                schedule_repeat_op = Some(result.operation.clone());
+                            }
+                            break;
                         }
                     }
-                    self.append_message(&result.message);
-                    
-                    // If this is a progress message, just append it and continue
-                    // If it's the final result, mark operation as complete
-                    if !result.is_progress {
+                    Err(TryRecvError::Empty) => break,
+                    Err(TryRecvError::Disconnected) => {
+                        if !batched_messages.is_empty() {
+                            batched_messages.push('\n');
+                        }
+                        batched_messages.push_str("Operation worker disconnected unexpectedly");
                         self.operation_running.store(false, std::sync::atomic::Ordering::Relaxed);
-                        // Reset exit flag when operation completes (unless it's a kill_all shutdown)
-                        // This allows break button to work without closing the window
+                        // Reset exit flag when operation completes
                         self.exit_flag.store(false, std::sync::atomic::Ordering::Relaxed);
                         should_clear = true;
-                        if self.repeat_enabled && self.selected_operation == result.operation {
-                            schedule_repeat_op = Some(result.operation.clone());
-                        }
+                        break;
                     }
                 }
-                Err(TryRecvError::Empty) => {}
-                Err(TryRecvError::Disconnected) => {
-                    self.append_message("Operation worker disconnected unexpectedly");
-                    self.operation_running.store(false, std::sync::atomic::Ordering::Relaxed);
-                    // Reset exit flag when operation completes
-                    self.exit_flag.store(false, std::sync::atomic::Ordering::Relaxed);
-                    should_clear = true;
-                }
             }
         }
+        if !batched_messages.is_empty() {
+            self.append_message(&batched_messages);
+        }
 
         if should_clear {
             self.operation_task = None;
@@ -713,9 +752,9 @@ impl OperationsGUI {
         // Fetch current positions from stepper_gui before starting operation to ensure accuracy
         let mut positions_snapshot = self.stepper_positions
             .lock()
-            .map(|map| map.clone())
+            .map(|cached| cached.clone())
             .unwrap_or_default();
-        
+
         // Try to fetch fresh positions from stepper_gui socket before starting operation
         if let Some(ref arduino_ops) = self.arduino_ops {
             if let Ok(ops_guard) = arduino_ops.lock() {
@@ -723,26 +762,28 @@ impl OperationsGUI {
                 drop(ops_guard);
                 if let Ok(fresh_positions) = ArduinoStepperOps::fetch_positions_from_socket(&socket_path) {
                     // Update snapshot with fresh positions
-                    for (idx, pos) in fresh_positions.iter().enumerate() {
-                        positions_snapshot.insert(idx, *pos);
+                    if positions_snapshot.len() < fresh_positions.len() {
+                        positions_snapshot.resize(fresh_positions.len(), 0);
                     }
-                    // Also update stepper_positions map
-                    if let Ok(mut map) = self.stepper_positions.lock() {
-                        for (idx, pos) in fresh_positions.iter().enumerate() {
-                            map.insert(idx, *pos);
+                    positions_snapshot[..fresh_positions.len()].copy_from_slice(&fresh_positions);
+                    // Also update stepper_positions cache
+                    if let Ok(mut cached) = self.stepper_positions.lock() {
+                        if cached.len() < fresh_positions.len() {
+                            cached.resize(fresh_positions.len(), 0);
                         }
+                        cached[..fresh_positions.len()].copy_from_slice(&fresh_positions);
                     }
                 }
             }
         }
-        
+
         let max_idx = all_indices.iter().max().copied().unwrap_or(0);
         let mut positions = vec![0i32; max_idx + 1];
         for &idx in &all_indices {
             if idx < positions.len() {
                 // Use fresh position from snapshot if available, otherwise use 0 as fallback
                 // Note: This is a read-only initialization - actual positions come from Arduino
-                positions[idx] = positions_snapshot.get(&idx).copied().unwrap_or(0);
+                positions[idx] = positions_snapshot.get(idx).copied().unwrap_or(0);
             }
         }
         let mut max_positions = std::collections::HashMap::new();
@@ -1446,7 +1487,9 @@ impl OperationsGUI {
             ui.heading("Stepper Enable/Disable");
             ui.label("(Controls which steppers participate in operations/bump_check)");
 
-            let (z_indices, bump_status, num_pairs, z_first, x_step_index, tuner_indices) = {
+            // Snapshot the enabled map once per frame instead of re-locking
+            // per checkbox; set_stepper_enabled still goes through on change.
+            let (z_indices, bump_status, num_pairs, z_first, x_step_index, tuner_indices, enabled_map) = {
                 let ops_guard = self.operations.read().unwrap();
                 (
                     ops_guard.get_z_stepper_indices(),
@@ -1455,27 +1498,20 @@ impl OperationsGUI {
                     ops_guard.z_first_index,
                     ops_guard.x_step_index(),
                     ops_guard.tuner_indices(),
+                    ops_guard.get_all_stepper_enabled(),
                 )
             };
 
             if let Some(x_idx) = x_step_index {
                 ui.horizontal(|ui| {
-                    let mut enabled = self.operations.read().unwrap().get_stepper_enabled(x_idx);
-                    if ui.checkbox(&mut enabled, format!("Stepper {} (X)", x_idx)).changed() {
-                        self.operations.read().unwrap().set_stepper_enabled(x_idx, enabled);
-                        self.append_message(&format!("Stepper {} {}", x_idx, if enabled { "enabled" } else { "disabled" }));
-                    }
+                    self.stepper_enable_checkbox(ui, x_idx, &format!("Stepper {} (X)", x_idx), &enabled_map, None);
                 });
             }
 
             if !tuner_indices.is_empty() {
                 ui.label("Tuners:");
                 for (t_idx, step_idx) in tuner_indices.iter().enumerate() {
-                    let mut enabled = self.operations.read().unwrap().get_stepper_enabled(*step_idx);
-                    if ui.checkbox(&mut enabled, format!("Stepper {} (T{})", step_idx, t_idx)).changed() {
-                        self.operations.read().unwrap().set_stepper_enabled(*step_idx, enabled);
-                        self.append_message(&format!("Stepper {} {}", step_idx, if enabled { "enabled" } else { "disabled" }));
-                    }
+                    self.stepper_enable_checkbox(ui, *step_idx, &format!("Stepper {} (T{})", step_idx, t_idx), &enabled_map, None);
                 }
             }
 
@@ -1489,61 +1525,36 @@ impl OperationsGUI {
                 let left_idx = z_first + (row * 2) + 1;  // "out" stepper (odd)
                 let right_idx = z_first + (row * 2);     // "in" stepper (even)
                 
-                // Check if indices are valid
-                if !z_indices.contains(&left_idx) || !z_indices.contains(&right_idx) {
+                // Check if indices are valid - Z indices are contiguous from
+                // z_first, so a bounds compare replaces the linear contains()
+                if (row * 2) + 1 >= z_indices.len() {
                     continue;
                 }
                 
                 ui.horizontal(|ui| {
                     // Left column: "out" stepper (Stepper2)
                     ui.vertical(|ui| {
-                        let mut enabled = self.operations.read().unwrap().get_stepper_enabled(left_idx);
-                        let is_bumping = bump_map.get(&left_idx).copied().unwrap_or(false);
-                        
-                        let label = format!("Stepper {} (Z{})", 
-                            left_idx, 
-                            left_idx - z_first,
-                        );
-                        
                         ui.horizontal(|ui| {
-                            if ui.checkbox(&mut enabled, &label).changed() {
-                                self.operations.read().unwrap().set_stepper_enabled(left_idx, enabled);
-                                self.append_message(&format!("Stepper {} {}", left_idx, if enabled { "enabled" } else { "disabled" }));
-                            }
-                            
-                            let dot_color = if is_bumping {
-                                egui::Color32::from_rgb(220, 0, 0)
-                            } else {
-                                egui::Color32::from_gray(120)
-                            };
-                            let (rect, _) = ui.allocate_exact_size(egui::Vec2::new(14.0, 14.0), egui::Sense::hover());
-                            ui.painter().circle_filled(rect.center(), 5.0, dot_color);
+                            self.stepper_enable_checkbox(
+                                ui,
+                                left_idx,
+                                &format!("Stepper {} (Z{})", left_idx, left_idx - z_first),
+                                &enabled_map,
+                                Some(bump_map.get(&left_idx).copied().unwrap_or(false)),
+                            );
                         });
                     });
-                    
+
                     // Right column: "in" stepper (Stepper1)
                     ui.vertical(|ui| {
-                        let mut enabled = self.operations.read().unwrap().get_stepper_enabled(right_idx);
-                        let is_bumping = bump_map.get(&right_idx).copied().unwrap_or(false);
-                        
-                        let label = format!("Stepper {} (Z{})", 
-                            right_idx, 
-                            right_idx - z_first,
-                        );
-                        
                         ui.horizontal(|ui| {
-                            if ui.checkbox(&mut enabled, &label).changed() {
-                                self.operations.read().unwrap().set_stepper_enabled(right_idx, enabled);
-                                self.append_message(&format!("Stepper {} {}", right_idx, if enabled { "enabled" } else { "disabled" }));
-                            }
-                            
-                            let dot_color = if is_bumping {
-                                egui::Color32::from_rgb(220, 0, 0)
-                            } else {
-                                egui::Color32::from_gray(120)
-                            };
-                            let (rect, _) = ui.allocate_exact_size(egui::Vec2::new(14.0, 14.0), egui::Sense::hover());
-                            ui.painter().circle_filled(rect.center(), 5.0, dot_color);
+                            self.stepper_enable_checkbox(
+                                ui,
+                                right_idx,
+                                &format!("Stepper {} (Z{})", right_idx, right_idx - z_first),
+                                &enabled_map,
+                                Some(bump_map.get(&right_idx).copied().unwrap_or(false)),
+                            );
                         });
                     });
                 });
@@ -109,6 +109,13 @@ pub struct StepperGUI {
     command_set: CommandSet,
     tuner_command_set: CommandSet,
     x_max_pos: Option<i32>, // X_MAX_POS from config for slider range
+    tx_buf: Vec<u8>, // Reusable serial frame buffer - avoids per-command allocation
+    // Static widget labels, formatted once at startup - the UI is rebuilt
+    // every frame and these strings never change
+    stepper_out_labels: Vec<String>,
+    stepper_in_labels: Vec<String>,
+    tuner_labels: Vec<String>,
+    x_axis_label: String,
 }
 
 impl Default for StepperGUI {
@@ -152,13 +159,17 @@ impl Default for StepperGUI {
             command_set: CommandSet::for_firmware(ArduinoFirmware::StringDriverV2),
             tuner_command_set: CommandSet::for_firmware(ArduinoFirmware::StringDriverV2),
             x_max_pos: None,
+            tx_buf: Vec::with_capacity(20),
+            stepper_out_labels: Vec::new(),
+            stepper_in_labels: Vec::new(),
+            tuner_labels: Vec::new(),
+            x_axis_label: String::new(),
         }
     }
 }
 
 impl StepperGUI {
     fn write_positions_response(stream: &mut UnixStream, positions: &[i32]) -> std::io::Result<()> {
-        use std::io::Write;
         let mut response = String::from("positions");
         for (idx, pos) in positions.iter().enumerate() {
             response.push(' ');
@@ -173,6 +184,10 @@ impl StepperGUI {
         let mut s = Self::default();
         s.port_path = port_path;
         s.positions = vec![0; num_steppers];
+        s.stepper_out_labels = (0..num_steppers).map(|i| format!("Stepper {} (out)", i)).collect();
+        s.stepper_in_labels = (0..num_steppers).map(|i| format!("Stepper {} (in)", i)).collect();
+        s.tuner_labels = (0..tuner_num_steppers.unwrap_or(0)).map(|i| format!("Tuner {}", i)).collect();
+        s.x_axis_label = x_step_index.map(|x| format!("X-axis (Stepper {}):", x)).unwrap_or_default();
         s.debug_enabled = debug;
         s.debug_file = debug_file;
         s.string_num = string_num;
@@ -223,46 +238,41 @@ impl StepperGUI {
     
     /// Handle a text command from Unix socket
     fn handle_command(&mut self, cmd: &str, mut responder: Option<&mut UnixStream>) {
-        let parts: Vec<&str> = cmd.trim().split_whitespace().collect();
-        if parts.is_empty() {
-            return;
-        }
-        
-        match parts[0] {
+        // Commands arrive in bursts during sweeps, so walk the tokens lazily
+        // instead of collecting them into a heap Vec per command.
+        let mut parts = cmd.trim().split_whitespace();
+        let name = match parts.next() {
+            Some(name) => name,
+            None => return,
+        };
+
+        match name {
             "rel_move" => {
-                if parts.len() == 3 {
-                    if let (Ok(stepper), Ok(delta)) = (parts[1].parse::<usize>(), parts[2].parse::<i32>()) {
+                if let (Some(stepper), Some(delta), None) = (parts.next(), parts.next(), parts.next()) {
+                    if let (Ok(stepper), Ok(delta)) = (stepper.parse::<usize>(), delta.parse::<i32>()) {
                         self.log(&format!("IPC: rel_move {} {}", stepper, delta));
                         self.move_stepper_ipc(stepper, delta);
                     }
                 }
             }
             "abs_move" => {
-                if parts.len() == 3 {
-                    if let (Ok(stepper), Ok(position)) = (parts[1].parse::<usize>(), parts[2].parse::<i32>()) {
+                if let (Some(stepper), Some(position), None) = (parts.next(), parts.next(), parts.next()) {
+                    if let (Ok(stepper), Ok(position)) = (stepper.parse::<usize>(), position.parse::<i32>()) {
                         self.log(&format!("IPC: abs_move {} {}", stepper, position));
                         self.move_stepper_absolute_with_source("IPC", stepper, position);
                     }
                 }
             }
             "reset" => {
-                if parts.len() == 3 {
-                    if let (Ok(stepper), Ok(position)) = (parts[1].parse::<usize>(), parts[2].parse::<i32>()) {
+                if let (Some(stepper), Some(position), None) = (parts.next(), parts.next(), parts.next()) {
+                    if let (Ok(stepper), Ok(position)) = (stepper.parse::<usize>(), position.parse::<i32>()) {
                         self.log(&format!("IPC: reset {} {} (set_stepper - no physical move)", stepper, position));
                         self.reset_position(stepper, position);
                     }
                 }
             }
-            "get_x_step" => {
-                if let Some(ref mut resp) = responder {
-                    use std::io::Write;
-                    let _ = resp.write_all(format!("{}\n", self.x_step).as_bytes());
-                    let _ = resp.flush();
-                }
-            }
             "get_x_step" => {
                 if let Some(stream) = responder.as_deref_mut() {
-                    use std::io::Write;
                     let _ = stream.write_all(format!("{}\n", self.x_step).as_bytes());
                     let _ = stream.flush();
                 }
@@ -382,20 +392,18 @@ impl StepperGUI {
             }
         }
     }
-    fn escape_cmdmessenger_bytes(data: &[u8]) -> Vec<u8> {
-        // PyCmdMessenger escapes: field separator (','), command separator (';'), 
+    fn escape_cmdmessenger_into(buf: &mut Vec<u8>, data: &[u8]) {
+        // PyCmdMessenger escapes: field separator (','), command separator (';'),
         // escape separator ('/'), and null bytes ('\0')
-        let mut out = Vec::with_capacity(data.len() * 2); // May double in size if all bytes escaped
         for &b in data {
             match b {
-                b'/' | b',' | b';' | 0 => { 
-                    out.push(b'/'); 
-                    out.push(b); 
+                b'/' | b',' | b';' | 0 => {
+                    buf.push(b'/');
+                    buf.push(b);
                 }
-                _ => out.push(b),
+                _ => buf.push(b),
             }
         }
-        out
     }
 
     fn pack_i16_le(v: i16) -> [u8; 2] {
@@ -406,25 +414,28 @@ impl StepperGUI {
         i32::to_le_bytes(v)
     }
 
-    fn send_cmd_bin(&mut self, cmd_id: u8, stepper_idx: i16, value: i32) {
+    /// Encode one CmdMessenger frame into `buf` (cleared first). Writing into
+    /// a reusable buffer keeps tight calibration loops allocation-free.
+    fn encode_cmd_frame(buf: &mut Vec<u8>, cmd_id: u8, stepper_idx: i16, value: i32) {
         // PyCmdMessenger sends "il" format: int (2 bytes) for stepper, long (4 bytes) for value
         // But Arduino reads both as int - that's fine, it just reads first 2 bytes of the long
-        if self.port.is_none() { return; }
-        let mut buf: Vec<u8> = Vec::with_capacity(20);
+        buf.clear();
         // Command ID as ASCII digit
         buf.push(b'0' + cmd_id);
         buf.push(b',');
         // First arg: stepper index as 2-byte int
-        let stepper_bytes = Self::pack_i16_le(stepper_idx);
-        let escaped_stepper = Self::escape_cmdmessenger_bytes(&stepper_bytes);
-        buf.extend_from_slice(&escaped_stepper);
+        Self::escape_cmdmessenger_into(buf, &Self::pack_i16_le(stepper_idx));
         buf.push(b',');
         // Second arg: value as 4-byte long (Arduino reads as int, takes first 2 bytes)
-        let value_bytes = Self::pack_i32_le(value);
-        let escaped_value = Self::escape_cmdmessenger_bytes(&value_bytes);
-        buf.extend_from_slice(&escaped_value);
+        Self::escape_cmdmessenger_into(buf, &Self::pack_i32_le(value));
         buf.push(b';');
-        // self.log(&format!("SEND BIN: {:?}", buf));
+    }
+
+    fn send_cmd_bin(&mut self, cmd_id: u8, stepper_idx: i16, value: i32) {
+        if self.port.is_none() { return; }
+        // Take the buffer so the port can be borrowed mutably alongside it
+        let mut buf = std::mem::take(&mut self.tx_buf);
+        Self::encode_cmd_frame(&mut buf, cmd_id, stepper_idx, value);
         let write_err = if let Some(p) = self.port.as_mut() {
             p.write_all(&buf).err()
         } else {
@@ -435,6 +446,7 @@ impl StepperGUI {
         } else {
             None
         };
+        self.tx_buf = buf;
         if let Some(e) = write_err {
             self.log(&format!("ERROR: Failed to write to port: {}", e));
         }
@@ -446,16 +458,69 @@ impl StepperGUI {
         // Always log to GUI buffer, even without debug flag
         self.debug_log.push_str(message);
         self.debug_log.push('\n');
-        // Keep log size manageable
+        // Keep log size manageable (drain in place - no replacement allocation)
         if self.debug_log.len() > 10000 {
-            self.debug_log = self.debug_log.split_off(self.debug_log.len() - 5000);
+            let cut = self.debug_log.len() - 5000;
+            self.debug_log.drain(..cut);
         }
         if self.debug_enabled {
             println!("DEBUG: {}", message);
             if let Some(f) = self.debug_file.as_mut() {
-                let _ = f.write_all(format!("{}\n", message).as_bytes());
+                let _ = f.write_all(message.as_bytes());
+                let _ = f.write_all(b"\n");
+            }
+        }
+    }
+
+    /// Set the ASYNC_LOW_LATENCY flag on a serial port (Linux only).
+    /// Drops the FTDI/USB-serial latency timer from its 16ms default to ~1ms,
+    /// which directly shortens every command/positions round-trip.
+    #[cfg(target_os = "linux")]
+    fn enable_low_latency(&mut self, port: &serialport::TTYPort) {
+        use std::os::unix::io::AsRawFd;
+
+        const TIOCGSERIAL: libc::c_ulong = 0x541E;
+        const TIOCSSERIAL: libc::c_ulong = 0x541F;
+        const ASYNC_LOW_LATENCY: libc::c_int = 0x2000;
+
+        // Kernel struct serial_struct (include/uapi/linux/serial.h)
+        #[repr(C)]
+        struct SerialStruct {
+            type_: libc::c_int,
+            line: libc::c_int,
+            port: libc::c_uint,
+            irq: libc::c_int,
+            flags: libc::c_int,
+            xmit_fifo_size: libc::c_int,
+            custom_divisor: libc::c_int,
+            baud_base: libc::c_int,
+            close_delay: libc::c_ushort,
+            io_type: libc::c_char,
+            reserved_char: libc::c_char,
+            hub6: libc::c_int,
+            closing_wait: libc::c_ushort,
+            closing_wait2: libc::c_ushort,
+            iomem_base: *mut libc::c_uchar,
+            iomem_reg_shift: libc::c_ushort,
+            port_high: libc::c_uint,
+            iomap_base: libc::c_ulong,
+        }
+
+        let fd = port.as_raw_fd();
+        unsafe {
+            let mut serial: SerialStruct = std::mem::zeroed();
+            if libc::ioctl(fd, TIOCGSERIAL, &mut serial) != 0 {
+                // Not all drivers support this (e.g. CDC-ACM boards) - not an error
+                self.log("Low-latency mode not supported on this port");
+                return;
+            }
+            serial.flags |= ASYNC_LOW_LATENCY;
+            if libc::ioctl(fd, TIOCSSERIAL, &serial) != 0 {
+                self.log("Failed to set low-latency mode on port");
+                return;
             }
         }
+        self.log("Low-latency mode enabled on port");
     }
 
     pub fn connect(&mut self) {
@@ -464,11 +529,13 @@ impl StepperGUI {
         self.log(&format!("Connecting to Arduino on {} @115200", port_path));
         match serialport::new(port_path.as_str(), 115200)
             .timeout(Duration::from_secs(2))
-            .open() {
+            .open_native() {
             Ok(port) => {
                 self.log("Port opened, waiting 2s for Arduino reset...");
+                #[cfg(target_os = "linux")]
+                self.enable_low_latency(&port);
                 thread::sleep(Duration::from_millis(2000));
-                self.port = Some(port);
+                self.port = Some(Box::new(port));
                 self.connected = true;
                 self.log("Connected. Requesting positions...");
                 self.refresh_positions();
@@ -495,12 +562,15 @@ impl StepperGUI {
                 thread::sleep(Duration::from_millis(50));
                 
                 // Read in a loop until we get complete message (ending with ';') or timeout
-                let mut buffer = Vec::new();
+                // Pre-sized buffers: scratch lives on the stack and the accumulator
+                // reserves the expected frame size up front, so the poll loop
+                // never allocates.
+                let mut buffer = Vec::with_capacity(256);
+                let mut chunk = [0u8; 256];
                 let start_time = std::time::Instant::now();
                 let timeout = Duration::from_secs(2);
-                
+
                 while start_time.elapsed() < timeout {
-                    let mut chunk = vec![0u8; 256];
                     match port.read(&mut chunk) {
                         Ok(bytes_read) if bytes_read > 0 => {
                             buffer.extend_from_slice(&chunk[..bytes_read]);
@@ -515,8 +585,7 @@ impl StepperGUI {
                         }
                         Err(e) => {
                             // Timeout errors are expected - wait and retry
-                            let err_str = e.to_string();
-                            if err_str.contains("timeout") || err_str.contains("TimedOut") {
+                            if e.kind() == std::io::ErrorKind::TimedOut {
                                 thread::sleep(Duration::from_millis(10));
                                 continue;
                             }
@@ -570,16 +639,19 @@ impl StepperGUI {
                         expected_bytes, data_bytes.len()
                     ));
                 }
-                let mut positions = vec![0i32; num];
+                // Decode in place - self.positions is preallocated at the
+                // stepper count and never changes size (matches the tuner path)
                 for idx in 0..num {
                     let lo = idx * 2;
                     let hi = lo + 1;
-                    if hi < data_bytes.len() {
-                        positions[idx] = i16::from_le_bytes([data_bytes[lo], data_bytes[hi]]) as i32;
-                    }
+                    self.positions[idx] = if hi < data_bytes.len() {
+                        i16::from_le_bytes([data_bytes[lo], data_bytes[hi]]) as i32
+                    } else {
+                        0
+                    };
                 }
-                self.log(&format!("PARSED positions: {:?}", positions));
-                self.positions = positions;
+                let log_msg = format!("PARSED positions: {:?}", self.positions);
+                self.log(&log_msg);
             } else {
                 self.log("READ ERROR: failed to read from serial port");
             }
@@ -596,7 +668,7 @@ impl StepperGUI {
 
     fn move_stepper_with_source(&mut self, source: &str, stepper: usize, delta: i32) {
         if self.port.is_none() {
-            self.log(&format!("ERROR: Cannot move - port not connected"));
+            self.log("ERROR: Cannot move - port not connected");
             return;
         }
         // Flush input before command (mirror Python's flush_input_before_command)
@@ -611,18 +683,36 @@ impl StepperGUI {
         } else {
             delta
         };
+        // One log line per move: the command itself. The old per-step
+        // "waiting"/"refreshing" progress lines carried no information and
+        // flooded the debug buffer during calibration bursts.
         self.log(&format!(">>> {} MOVING stepper {} by {} (rmove command, adjusted: {})", source, stepper, delta, adjusted_delta));
         self.send_cmd_bin(self.command_set.rmove_id, s, adjusted_delta);
-        self.log(&format!("Command sent, waiting for Arduino..."));
-        // Arduino move is synchronous - wait for it to complete
-        thread::sleep(Duration::from_millis(500));
-        self.log(&format!("Refreshing positions..."));
+        self.wait_for_move_complete();
+    }
+
+    /// Wait for a move to finish, event-driven instead of a fixed 500ms sleep.
+    /// The Arduino services commands serially, so a positions request is only
+    /// answered once the move completes; poll until two consecutive reads
+    /// agree (or give up after a bounded number of attempts).
+    fn wait_for_move_complete(&mut self) {
+        const MAX_ATTEMPTS: usize = 8;
         self.refresh_positions();
+        let mut last = self.positions.clone();
+        for _ in 0..MAX_ATTEMPTS {
+            thread::sleep(Duration::from_millis(50));
+            self.refresh_positions();
+            if self.positions == last {
+                return;
+            }
+            last = self.positions.clone();
+        }
+        self.log("WARN: positions did not stabilize after move");
     }
 
     fn move_stepper_absolute_with_source(&mut self, source: &str, stepper: usize, position: i32) {
         if self.port.is_none() {
-            self.log(&format!("ERROR: Cannot move - port not connected"));
+            self.log("ERROR: Cannot move - port not connected");
             return;
         }
         // Flush input before command (mirror Python's flush_input_before_command)
@@ -632,16 +722,12 @@ impl StepperGUI {
         let s = stepper as i16;
         self.log(&format!(">>> {} MOVING stepper {} to absolute position {} (amove command)", source, stepper, position));
         self.send_cmd_bin(self.command_set.amove_id, s, position);
-        self.log(&format!("Command sent, waiting for Arduino..."));
-        // Arduino move is synchronous - wait for it to complete
-        thread::sleep(Duration::from_millis(500));
-        self.log(&format!("Refreshing positions..."));
-        self.refresh_positions();
+        self.wait_for_move_complete();
     }
 
     fn reset_position(&mut self, stepper: usize, position: i32) {
         if self.port.is_none() {
-            self.log(&format!("ERROR: Cannot reset position - port not connected"));
+            self.log("ERROR: Cannot reset position - port not connected");
             return;
         }
         // Flush input before command
@@ -651,16 +737,14 @@ impl StepperGUI {
         let s = stepper as i16;
         self.log(&format!(">>> RESETTING stepper {} to {} (set_stepper command - no physical move)", stepper, position));
         self.send_cmd_bin(self.command_set.set_stepper_id, s, position);
-        self.log(&format!("Command sent, waiting for Arduino..."));
-        // set_stepper is fast - just sets internal counter
-        thread::sleep(Duration::from_millis(100));
-        self.log(&format!("Refreshing positions..."));
+        // set_stepper just sets the internal counter; the positions request is
+        // serviced after it, so the refresh itself confirms completion.
         self.refresh_positions();
     }
 
     fn set_accel(&mut self, stepper: usize, accel: i32) {
         if self.port.is_none() {
-            self.log(&format!("ERROR: Cannot set acceleration - port not connected"));
+            self.log("ERROR: Cannot set acceleration - port not connected");
             return;
         }
         if let Some(p) = self.port.as_mut() {
@@ -673,7 +757,7 @@ impl StepperGUI {
 
     fn set_speed(&mut self, stepper: usize, speed: i32) {
         if self.port.is_none() {
-            self.log(&format!("ERROR: Cannot set speed - port not connected"));
+            self.log("ERROR: Cannot set speed - port not connected");
             return;
         }
         if let Some(p) = self.port.as_mut() {
@@ -686,7 +770,7 @@ impl StepperGUI {
 
     fn set_min(&mut self, axis: usize, min_val: i32) {
         if self.port.is_none() {
-            self.log(&format!("ERROR: Cannot set min - port not connected"));
+            self.log("ERROR: Cannot set min - port not connected");
             return;
         }
         if let Some(p) = self.port.as_mut() {
@@ -699,7 +783,7 @@ impl StepperGUI {
 
     fn set_max(&mut self, axis: usize, max_val: i32) {
         if self.port.is_none() {
-            self.log(&format!("ERROR: Cannot set max - port not connected"));
+            self.log("ERROR: Cannot set max - port not connected");
             return;
         }
         if let Some(p) = self.port.as_mut() {
@@ -717,11 +801,13 @@ impl StepperGUI {
             self.log(&format!("Connecting to tuner Arduino on {} @115200", port_path));
             match serialport::new(port_path.as_str(), 115200)
                 .timeout(Duration::from_secs(2))
-                .open() {
+                .open_native() {
                 Ok(port) => {
                     self.log("Tuner port opened, waiting 2s for Arduino reset...");
+                    #[cfg(target_os = "linux")]
+                    self.enable_low_latency(&port);
                     thread::sleep(Duration::from_millis(2000));
-                    self.tuner_port = Some(port);
+                    self.tuner_port = Some(Box::new(port));
                     self.tuner_connected = true;
                     self.log("Tuner connected. Requesting positions...");
                     self.refresh_tuner_positions();
@@ -750,12 +836,12 @@ impl StepperGUI {
                 let _ = port.flush();
                 thread::sleep(Duration::from_millis(50));
                 
-                let mut buffer = Vec::new();
+                let mut buffer = Vec::with_capacity(256);
+                let mut chunk = [0u8; 256];
                 let start_time = std::time::Instant::now();
                 let timeout = Duration::from_secs(2);
-                
+
                 while start_time.elapsed() < timeout {
-                    let mut chunk = vec![0u8; 256];
                     match port.read(&mut chunk) {
                         Ok(bytes_read) if bytes_read > 0 => {
                             buffer.extend_from_slice(&chunk[..bytes_read]);
@@ -767,8 +853,7 @@ impl StepperGUI {
                             thread::sleep(Duration::from_millis(10));
                         }
                         Err(e) => {
-                            let err_str = e.to_string();
-                            if err_str.contains("timeout") || err_str.contains("TimedOut") {
+                            if e.kind() == std::io::ErrorKind::TimedOut {
                                 thread::sleep(Duration::from_millis(10));
                                 continue;
                             }
@@ -888,21 +973,13 @@ impl StepperGUI {
 
     fn send_cmd_bin_tuner(&mut self, cmd_id: u8, stepper_idx: i16, value: i32) {
         if self.tuner_port.is_none() { return; }
-        let mut buf: Vec<u8> = Vec::with_capacity(20);
-        buf.push(b'0' + cmd_id);
-        buf.push(b',');
-        let stepper_bytes = Self::pack_i16_le(stepper_idx);
-        let escaped_stepper = Self::escape_cmdmessenger_bytes(&stepper_bytes);
-        buf.extend_from_slice(&escaped_stepper);
-        buf.push(b',');
-        let value_bytes = Self::pack_i32_le(value);
-        let escaped_value = Self::escape_cmdmessenger_bytes(&value_bytes);
-        buf.extend_from_slice(&escaped_value);
-        buf.push(b';');
+        let mut buf = std::mem::take(&mut self.tx_buf);
+        Self::encode_cmd_frame(&mut buf, cmd_id, stepper_idx, value);
         if let Some(p) = self.tuner_port.as_mut() {
             let _ = p.write_all(&buf);
             let _ = p.flush();
         }
+        self.tx_buf = buf;
     }
 
     fn set_tuner_accel(&mut self, tuner_idx: usize, accel: i32) {
@@ -978,6 +1055,12 @@ impl StepperGUI {
     fn apply_z_params_to_all(&mut self) {
         // Apply z parameters to all z steppers using Z_FIRST_INDEX from config
         if let Some(z_first) = self.z_first_index {
+            // Min/max are per-axis (axis 1 = Z), not per-stepper - one roundtrip
+            // each covers every Z stepper, so send them once outside the loop.
+            self.set_min(1, self.z_min);
+            thread::sleep(Duration::from_millis(10));
+            self.set_max(1, self.z_max);
+            thread::sleep(Duration::from_millis(10));
             let num_z = self.string_num * 2; // Each string has 2 Z steppers (in/out)
             for i in 0..num_z {
                 let stepper_idx = z_first + i;
@@ -986,17 +1069,20 @@ impl StepperGUI {
                     thread::sleep(Duration::from_millis(10));
                     self.set_speed(stepper_idx, self.z_speed);
                     thread::sleep(Duration::from_millis(10));
-                    // Iterate through all Z steppers for min/max too
-                    self.set_min(1, self.z_min);
-                    thread::sleep(Duration::from_millis(10));
-                    self.set_max(1, self.z_max);
-                    thread::sleep(Duration::from_millis(10));
                 }
             }
         }
     }
 }
 
+/// True when a parameter edit should be pushed to the Arduino: the value
+/// changed outside a drag (typed edit) or a drag gesture just ended. Skipping
+/// mid-drag ticks coalesces a slider gesture into one serial command instead
+/// of one per frame.
+fn drag_value_settled(response: &egui::Response) -> bool {
+    response.drag_stopped() || (response.changed() && !response.dragged())
+}
+
 impl StepperGUI {
     /// Render the UI content (can be called from panels or standalone)
     pub fn render_ui(&mut self, ui: &mut egui::Ui, ctx: &egui::Context) {
@@ -1009,8 +1095,8 @@ impl StepperGUI {
         ctx.request_repaint_after(Duration::from_millis(500));
 
 
-            // Channel colors matching plot.rs color scheme
-            let channel_colors = vec![
+            // Channel colors matching plot.rs color scheme (const - no per-frame rebuild)
+            const CHANNEL_COLORS: [Color32; 6] = [
                 Color32::from_rgb(0, 0, 255),      // Blue
                 Color32::from_rgb(255, 165, 0),    // Orange
                 Color32::from_rgb(0, 255, 0),       // Green
@@ -1018,6 +1104,7 @@ impl StepperGUI {
                 Color32::from_rgb(238, 130, 238),   // Magenta
                 Color32::from_rgb(165, 42, 42),    // Brown
             ];
+            let channel_colors = &CHANNEL_COLORS;
 
             // Check if X stepper exists using X_STEP_INDEX from config
             // COMMENTED OUT: X offset feature for Z stepper layout
@@ -1040,7 +1127,7 @@ impl StepperGUI {
                         ui.horizontal(|ui| {
                             for tuner_idx in 0..num_tuners {
                                 ui.vertical(|ui| {
-                                    ui.label(format!("Tuner {}", tuner_idx));
+                                    ui.label(self.tuner_labels[tuner_idx].as_str());
                                     let channel_color = channel_colors[tuner_idx % channel_colors.len()];
                                     
                                     // Get tuner position
@@ -1133,7 +1220,7 @@ impl StepperGUI {
                         ui.horizontal(|ui| {
                             ui.label("Accel:");
                             let accel_response = ui.add(egui::DragValue::new(&mut self.tuner_accel).speed(100.0));
-                            if accel_response.changed() {
+                            if drag_value_settled(&accel_response) {
                                 for tuner_idx in 0..num_tuners {
                                     self.set_tuner_accel(tuner_idx, self.tuner_accel);
                                     thread::sleep(Duration::from_millis(10));
@@ -1141,7 +1228,7 @@ impl StepperGUI {
                             }
                             ui.label("Speed:");
                             let speed_response = ui.add(egui::DragValue::new(&mut self.tuner_speed).speed(10.0));
-                            if speed_response.changed() {
+                            if drag_value_settled(&speed_response) {
                                 for tuner_idx in 0..num_tuners {
                                     self.set_tuner_speed(tuner_idx, self.tuner_speed);
                                     thread::sleep(Duration::from_millis(10));
@@ -1151,7 +1238,7 @@ impl StepperGUI {
                         ui.horizontal(|ui| {
                             ui.label("Min:");
                             let min_response = ui.add(egui::DragValue::new(&mut self.tuner_min).speed(1000.0));
-                            if min_response.changed() {
+                            if drag_value_settled(&min_response) {
                                 for tuner_idx in 0..num_tuners {
                                     self.set_tuner_min(tuner_idx, self.tuner_min);
                                     thread::sleep(Duration::from_millis(10));
@@ -1159,7 +1246,7 @@ impl StepperGUI {
                             }
                             ui.label("Max:");
                             let max_response = ui.add(egui::DragValue::new(&mut self.tuner_max).speed(1000.0));
-                            if max_response.changed() {
+                            if drag_value_settled(&max_response) {
                                 for tuner_idx in 0..num_tuners {
                                     self.set_tuner_max(tuner_idx, self.tuner_max);
                                     thread::sleep(Duration::from_millis(10));
@@ -1182,7 +1269,7 @@ impl StepperGUI {
                 if let Some(x_idx) = self.x_step_index {
                     if let Some(max_pos) = self.x_max_pos {
                         if max_pos > 0 && x_idx < self.positions.len() {
-                            ui.label(&format!("X-axis (Stepper {}):", x_idx));
+                            ui.label(self.x_axis_label.as_str());
                             
                             // Slider full width of window
                             let mut pos = self.positions[x_idx];
@@ -1264,24 +1351,24 @@ impl StepperGUI {
                             ui.horizontal(|ui| {
                                 ui.label("Accel:");
                                 let accel_response = ui.add(egui::DragValue::new(&mut self.x_accel).speed(100.0));
-                                if accel_response.changed() {
+                                if drag_value_settled(&accel_response) {
                                     self.set_accel(x_idx, self.x_accel);
                                 }
                                 ui.label("Speed:");
                                 let speed_response = ui.add(egui::DragValue::new(&mut self.x_speed).speed(10.0));
-                                if speed_response.changed() {
+                                if drag_value_settled(&speed_response) {
                                     self.set_speed(x_idx, self.x_speed);
                                 }
                             });
                             ui.horizontal(|ui| {
                                 ui.label("Min:");
                                 let min_response = ui.add(egui::DragValue::new(&mut self.x_min).speed(10.0));
-                                if min_response.changed() {
+                                if drag_value_settled(&min_response) {
                                     self.set_min(0, self.x_min);
                                 }
                                 ui.label("Max:");
                                 let max_response = ui.add(egui::DragValue::new(&mut self.x_max).speed(10.0));
-                                if max_response.changed() {
+                                if drag_value_settled(&max_response) {
                                     self.set_max(0, self.x_max);
                                 }
                             });
@@ -1326,7 +1413,7 @@ impl StepperGUI {
                             
                             // Left stepper ("out" stepper)
                             ui.vertical(|ui| {
-                                ui.label(format!("Stepper {} (out)", left_idx));
+                                ui.label(self.stepper_out_labels[left_idx].as_str());
                             
                             // Horizontal layout: slider on left, number box with buttons on right (tight spacing)
                             ui.with_layout(egui::Layout::left_to_right(egui::Align::Center).with_main_justify(false), |ui| {
@@ -1407,7 +1494,7 @@ impl StepperGUI {
                             
                             // Right stepper ("in" stepper)
                             ui.vertical(|ui| {
-                                ui.label(format!("Stepper {} (in)", right_idx));
+                                ui.label(self.stepper_in_labels[right_idx].as_str());
                             
                             // Horizontal layout: slider on left, number box with buttons on right (tight spacing)
                             ui.with_layout(egui::Layout::left_to_right(egui::Align::Center).with_main_justify(false), |ui| {
@@ -1493,24 +1580,24 @@ impl StepperGUI {
                 ui.horizontal(|ui| {
                     ui.label("Accel:");
                     let accel_response = ui.add(egui::DragValue::new(&mut self.z_accel).speed(100.0));
-                    if accel_response.changed() {
+                    if drag_value_settled(&accel_response) {
                         self.apply_z_params_to_all();
                     }
                     ui.label("Speed:");
                     let speed_response = ui.add(egui::DragValue::new(&mut self.z_speed).speed(10.0));
-                    if speed_response.changed() {
+                    if drag_value_settled(&speed_response) {
                         self.apply_z_params_to_all();
                     }
                 });
                 ui.horizontal(|ui| {
                     ui.label("Min:");
                     let min_response = ui.add(egui::DragValue::new(&mut self.z_min).speed(10.0));
-                    if min_response.changed() {
+                    if drag_value_settled(&min_response) {
                         self.apply_z_params_to_all();
                     }
                     ui.label("Max:");
                     let max_response = ui.add(egui::DragValue::new(&mut self.z_max).speed(10.0));
-                    if max_response.changed() {
+                    if drag_value_settled(&max_response) {
                         self.apply_z_params_to_all();
                     }
                 });
@@ -1553,8 +1640,6 @@ impl StepperGUI {
                         );
                     });
             });
-
-            ctx.request_repaint_after(Duration::from_millis(500));
     }
 }
 
@@ -58,7 +58,9 @@ pub struct MachineStateSnapshot {
     pub voice_count_max: Vec<i32>,
     pub amp_sum_min: Vec<i32>,
     pub amp_sum_max: Vec<i32>,
-    pub stepper_roles: Vec<StepperRoleEntry>,
+    // Arc-shared: roles are fixed at startup, so snapshots reference the same
+    // allocation instead of deep-copying the Vec (and its Strings) every tick.
+    pub stepper_roles: Arc<Vec<StepperRoleEntry>>,
 }
 
 #[derive(Clone)]
@@ -74,7 +76,7 @@ pub struct OperationEvent {
     pub final_positions: Vec<i32>,
 }
 
-#[derive(Clone)]
+#[derive(Clone, PartialEq)]
 pub struct StepperRoleEntry {
     pub stepper_index: usize,
     pub role: String,
@@ -86,6 +88,8 @@ pub struct MachineStateLogger {
     insert_state_stmt: Statement,
     insert_operation_stmt: Statement,
     stepper_role_table_ready: bool,
+    // Roles last written to host_config_stepper_roles - skip re-upserting unchanged rows
+    synced_roles: Option<(String, Vec<StepperRoleEntry>)>,
 }
 
 impl MachineStateLogger {
@@ -116,7 +120,7 @@ impl MachineStateLogger {
             .prepare("INSERT INTO operations (operation_id, state_id, host, recorded_at, operation_type, operation_status, message, stepper_indices, final_positions) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9)")
             .context("Failed to prepare operations SQL statement.")?;
 
-        Ok(Self { client, insert_state_stmt, insert_operation_stmt, stepper_role_table_ready: false })
+        Ok(Self { client, insert_state_stmt, insert_operation_stmt, stepper_role_table_ready: false, synced_roles: None })
     }
 
     fn insert_machine_state(&mut self, snapshot: &MachineStateSnapshot) -> Result<()> {
@@ -131,8 +135,8 @@ impl MachineStateLogger {
             &snapshot.bump_check_enable, &(snapshot.z_up_step as i32), &(snapshot.z_down_step as i32),
             &(snapshot.tune_rest as f32), &(snapshot.x_rest as f32), &(snapshot.z_rest as f32), &(snapshot.lap_rest as f32),
             &(snapshot.adjustment_level as i32), &(snapshot.retry_threshold as i32), &(snapshot.delta_threshold as i32), &(snapshot.z_variance_threshold as i32),
-            &snapshot.voice_count.iter().map(|&x| x as i32).collect::<Vec<i32>>(), &snapshot.amp_sum,
-            &snapshot.voice_count_min, &snapshot.voice_count_max, &snapshot.amp_sum_min.iter().map(|&x| x as i32).collect::<Vec<i32>>(), &snapshot.amp_sum_max.iter().map(|&x| x as i32).collect::<Vec<i32>>(),
+            &snapshot.voice_count, &snapshot.amp_sum,
+            &snapshot.voice_count_min, &snapshot.voice_count_max, &snapshot.amp_sum_min, &snapshot.amp_sum_max,
         ]).context("Failed to insert machine state record.")?;
         info!(target: "machine_state_logger", "Inserted machine state: id={}", snapshot.state_id);
         Ok(())
@@ -158,6 +162,13 @@ impl MachineStateLogger {
     }
 
     fn sync_stepper_roles(&mut self, host: &str, roles: &[StepperRoleEntry]) -> Result<()> {
+        // Roles are config-derived and rarely change; don't re-upsert every row
+        // on every 1Hz machine-state insert.
+        if let Some((synced_host, synced_roles)) = &self.synced_roles {
+            if synced_host == host && synced_roles.as_slice() == roles {
+                return Ok(());
+            }
+        }
         self.ensure_stepper_role_table()?;
         for entry in roles {
             let stepper_index = entry.stepper_index as i32;
@@ -172,6 +183,7 @@ impl MachineStateLogger {
                 &[&host, &stepper_index, &entry.role, &string_index]
             ).context("Failed to upsert host_config_stepper_roles")?;
         }
+        self.synced_roles = Some((host.to_string(), roles.to_vec()));
         Ok(())
     }
 
@@ -231,25 +243,55 @@ impl MachineStateLoggingContext {
 
     fn db_writer_thread(mut logger: MachineStateLogger, write_rx: Receiver<DbWriteCommand>) {
         info!(target: "machine_state_db_writer", "DB writer thread is active.");
+        // Cap matches the sync_channel capacity - one drain can never exceed it
+        const MAX_BATCH: usize = 100;
         let mut commands_processed = 0;
         let mut errors = 0;
         loop {
-            match write_rx.recv() {
-                Ok(DbWriteCommand::InsertMachineState(snapshot)) => {
-                    commands_processed += 1;
-                    if let Err(e) = logger.insert_machine_state(&snapshot) {
-                        errors += 1;
-                        error!(target: "machine_state_db_writer", "Failed to insert: {:#}", e);
-                    }
+            // Block for the first command, then drain whatever else is already
+            // queued so a burst of writes shares one transaction (one commit)
+            // instead of paying a roundtrip per row.
+            let first = match write_rx.recv() {
+                Ok(cmd) => cmd,
+                Err(_) => break,
+            };
+            let mut batch = vec![first];
+            while batch.len() < MAX_BATCH {
+                match write_rx.try_recv() {
+                    Ok(cmd) => batch.push(cmd),
+                    Err(_) => break,
+                }
+            }
+            let use_transaction = batch.len() > 1;
+            if use_transaction {
+                debug!(target: "machine_state_db_writer", "Draining batch of {} commands in one transaction", batch.len());
+                if let Err(e) = logger.client.batch_execute("BEGIN") {
+                    error!(target: "machine_state_db_writer", "Failed to begin batch transaction: {:#}", e);
                 }
-                Ok(DbWriteCommand::InsertOperation(event)) => {
-                    commands_processed += 1;
-                    if let Err(e) = logger.insert_operation(&event) {
-                        errors += 1;
-                        error!(target: "machine_state_db_writer", "Failed to insert: {:#}", e);
+            }
+            for cmd in batch {
+                match cmd {
+                    DbWriteCommand::InsertMachineState(snapshot) => {
+                        commands_processed += 1;
+                        if let Err(e) = logger.insert_machine_state(&snapshot) {
+                            errors += 1;
+                            error!(target: "machine_state_db_writer", "Failed to insert: {:#}", e);
+                        }
+                    }
+                    DbWriteCommand::InsertOperation(event) => {
+                        commands_processed += 1;
+                        if let Err(e) = logger.insert_operation(&event) {
+                            errors += 1;
+                            error!(target: "machine_state_db_writer", "Failed to insert: {:#}", e);
+                        }
                     }
                 }
-                Err(_) => break,
+            }
+            if use_transaction {
+                if let Err(e) = logger.client.batch_execute("COMMIT") {
+                    errors += 1;
+                    error!(target: "machine_state_db_writer", "Failed to commit batch transaction: {:#}", e);
+                }
             }
         }
         info!(target: "machine_state_db_writer", "DB writer stopped. Processed: {}, Errors: {}", commands_processed, errors);
@@ -277,7 +319,7 @@ impl MachineStateLoggingContext {
                 match tx.try_send(DbWriteCommand::InsertOperation(event.clone())) {
                     Ok(_) => {},
                     Err(std::sync::mpsc::TrySendError::Full(_)) => {
-                        warn!(target: "machine_state_logger", "DB write buffer is full.");
+                        warn!(target: "machine_state_logger", "{}", DB_BUFFER_FULL_MSG);
                     }
                     Err(_) => {},
                 }
@@ -19,28 +19,26 @@ type PartialsData = Vec<Vec<(f32, f32)>>;
 /// Type alias for partials slot (matches partials_slot::PartialsSlot)
 type PartialsSlot = Arc<Mutex<Option<PartialsData>>>;
 
-/// Calculate voice count per channel from partials data
-/// Returns Vec<usize> where each element is the count of non-zero amplitudes for that channel
-fn calculate_voice_count(partials: &PartialsData) -> Vec<usize> {
-    partials.iter()
-        .map(|channel_partials| {
-            channel_partials.iter()
-                .filter(|&&(_, amp)| amp > 0.0)
-                .count()
-        })
-        .collect()
-}
-
-/// Calculate amplitude sum per channel from partials data
-/// Returns Vec<f32> where each element is the sum of amplitudes for that channel
-fn calculate_amp_sum(partials: &PartialsData) -> Vec<f32> {
-    partials.iter()
-        .map(|channel_partials| {
-            channel_partials.iter()
-                .map(|&(_, amp)| amp)
-                .sum()
-        })
-        .collect()
+/// Calculate voice count and amplitude sum per channel from partials data
+/// in a single pass. Returns (voice_counts, amp_sums) where voice_count is
+/// the number of non-zero amplitudes and amp_sum the amplitude total for
+/// each channel.
+fn calculate_voice_amp(partials: &PartialsData) -> (Vec<usize>, Vec<f32>) {
+    let mut voice_counts = Vec::with_capacity(partials.len());
+    let mut amp_sums = Vec::with_capacity(partials.len());
+    for channel_partials in partials {
+        let mut count = 0usize;
+        let mut sum = 0.0f32;
+        for &(_, amp) in channel_partials {
+            if amp > 0.0 {
+                count += 1;
+            }
+            sum += amp;
+        }
+        voice_counts.push(count);
+        amp_sums.push(sum);
+    }
+    (voice_counts, amp_sums)
 }
 
 /// Calculate delta (difference) in amplitude sum between previous and current values per channel
@@ -56,8 +54,75 @@ fn calculate_amp_delta(previous: &[f32], current: &[f32]) -> Vec<f32> {
         .collect()
 }
 
+/// Channels whose amp delta exceeds the threshold get skipped for the next z_adjust pass
+fn calculate_skip_channels(amp_deltas: &[f32], delta_threshold: f32) -> HashSet<usize> {
+    amp_deltas.iter()
+        .enumerate()
+        .filter(|(_, delta)| **delta > delta_threshold)
+        .map(|(ch_idx, _)| ch_idx)
+        .collect()
+}
+
+/// Calculate Z variance: sum of absolute differences in voice counts between iterations
+/// Returns 0 if previous is empty or lengths don't match (first iteration / after calibration)
+fn calculate_z_variance(previous: &[usize], current: &[usize]) -> i32 {
+    if previous.is_empty() || previous.len() != current.len() {
+        return 0;
+    }
+    current.iter()
+        .zip(previous.iter())
+        .map(|(curr, last)| ((*curr as i32) - (*last as i32)).abs())
+        .sum()
+}
+
+/// Check whether every channel's voice_count AND amp_sum sit within their min/max ranges
+/// (the "green indicators" condition used by the sweep operations)
+fn voice_amp_within_limits(
+    voice_counts: &[usize],
+    amp_sums: &[f32],
+    min_thresholds: &[f32],
+    max_thresholds: &[f32],
+    min_voices: &[usize],
+    max_voices: &[usize],
+) -> bool {
+    let num_channels = amp_sums.len().min(voice_counts.len());
+    (0..num_channels).all(|ch_idx| {
+        let amp_sum = amp_sums[ch_idx];
+        let voice_count = voice_counts[ch_idx];
+
+        let min_thresh = min_thresholds.get(ch_idx).copied().unwrap_or(20.0);
+        let max_thresh = max_thresholds.get(ch_idx).copied().unwrap_or(100.0);
+        let min_voice = min_voices.get(ch_idx).copied().unwrap_or(0);
+        let max_voice = max_voices.get(ch_idx).copied().unwrap_or(12);
+
+        // Check both amp_sum and voice_count are within their ranges
+        amp_sum >= min_thresh && amp_sum <= max_thresh &&
+        voice_count >= min_voice && voice_count <= max_voice
+    })
+}
+
+/// Generate a set_/get_ accessor pair for an Arc<Mutex<_>> scalar parameter.
+/// Every pair is identical in shape: lock-and-assign on set, lock-and-copy
+/// on get with a fallback default if the lock is poisoned.
+macro_rules! shared_param {
+    ($set:ident, $get:ident, $field:ident, $ty:ty, $default:expr) => {
+        pub fn $set(&self, value: $ty) {
+            if let Ok(mut val) = self.$field.lock() {
+                *val = value;
+            }
+        }
+
+        pub fn $get(&self) -> $ty {
+            self.$field.lock().map(|v| *v).unwrap_or($default)
+        }
+    };
+}
+
 /// Stepper enable state tracking (index -> enabled)
-type StepperEnabled = Arc<Mutex<HashMap<usize, bool>>>;
+// Copy-on-write: readers share the map via a cheap Arc clone each tick;
+// the rare enable toggle (preset recall, critical-stuck disable) pays the
+// rebuild via Arc::make_mut
+type StepperEnabled = Arc<Mutex<Arc<HashMap<usize, bool>>>>;
 
 /// Trait for stepper operations - allows bump_check to work with different implementations
 pub trait StepperOperations {
@@ -90,6 +155,7 @@ pub struct Operations {
     pub x_step_index: Option<usize>,
     pub x_max_pos: Option<i32>,
     pub tuner_indices: Vec<usize>,
+    z_stepper_indices: Vec<usize>,
     pub stepper_enabled: StepperEnabled,
     pub gpio: Option<crate::gpio::GpioBoard>,
     arduino_connected: bool,
@@ -97,6 +163,9 @@ pub struct Operations {
     voice_count: Arc<Mutex<Vec<usize>>>, // Per-channel voice count
     amp_sum: Arc<Mutex<Vec<f32>>>, // Per-channel amplitude sum
     partials_slot: Option<PartialsSlot>, // Reference to shared partials slot
+    // GUI exit flag, registered once at startup so rest sleeps can be
+    // interrupted instead of blocking for the full rest interval
+    exit_flag: Arc<Mutex<Option<Arc<std::sync::atomic::AtomicBool>>>>,
 }
 
 impl Operations {
@@ -171,7 +240,11 @@ impl Operations {
         let x_finish = ops_settings.x_finish.unwrap_or(default_x_finish);
         let x_step = ops_settings.x_step.unwrap_or(10);
         let tuner_indices = mainboard_tuner_indices(&ard_settings);
-        
+        // Precompute once - derived purely from config, queried on every operation
+        let z_stepper_indices: Vec<usize> = (0..(string_num * 2))
+            .map(|i| z_first_index + i)
+            .collect();
+
         // Initialize stepper enabled states (all enabled by default)
         // Only initialize if Arduino is connected
         let mut stepper_enabled = HashMap::new();
@@ -209,7 +282,8 @@ impl Operations {
             x_step_index,
             x_max_pos,
             tuner_indices,
-            stepper_enabled: Arc::new(Mutex::new(stepper_enabled)),
+            z_stepper_indices,
+            stepper_enabled: Arc::new(Mutex::new(Arc::new(stepper_enabled))),
             gpio,
             arduino_connected,
             voice_count: {
@@ -227,51 +301,24 @@ impl Operations {
                 Arc::new(Mutex::new(vec![0.0; initial_size]))
             },
             partials_slot,
+            exit_flag: Arc::new(Mutex::new(None)),
         })
     }
-    
-    /// Set bump_check_enable state
-    pub fn set_bump_check_enable(&self, enabled: bool) {
-        if let Ok(mut enable) = self.bump_check_enable.lock() {
-            *enable = enabled;
-        }
-    }
-    
-    /// Get bump_check_enable state
-    pub fn get_bump_check_enable(&self) -> bool {
-        self.bump_check_enable.lock()
-            .map(|e| *e)
-            .unwrap_or(false)
-    }
-    
-    /// Set z_up_step value
-    pub fn set_z_up_step(&self, step: i32) {
-        if let Ok(mut step_val) = self.z_up_step.lock() {
-            *step_val = step;
-        }
-    }
-    
-    /// Get z_up_step value
-    pub fn get_z_up_step(&self) -> i32 {
-        self.z_up_step.lock()
-            .map(|s| *s)
-            .unwrap_or(2)
-    }
-    
-    /// Set z_down_step value
-    pub fn set_z_down_step(&self, step: i32) {
-        if let Ok(mut step_val) = self.z_down_step.lock() {
-            *step_val = step;
+
+    /// Register the GUI exit flag so long rest sleeps can be cut short when
+    /// the user presses Stop. Called once at GUI startup.
+    pub fn set_exit_flag(&self, flag: Arc<std::sync::atomic::AtomicBool>) {
+        if let Ok(mut slot) = self.exit_flag.lock() {
+            *slot = Some(flag);
         }
     }
     
-    /// Get z_down_step value
-    pub fn get_z_down_step(&self) -> i32 {
-        self.z_down_step.lock()
-            .map(|s| *s)
-            .unwrap_or(-2)
-    }
-    
+    // Lock-guarded scalar parameters (set_*/get_* pairs generated by
+    // shared_param!; the last argument is the default used on lock poison)
+    shared_param!(set_bump_check_enable, get_bump_check_enable, bump_check_enable, bool, false);
+    shared_param!(set_z_up_step, get_z_up_step, z_up_step, i32, 2);
+    shared_param!(set_z_down_step, get_z_down_step, z_down_step, i32, -2);
+
     pub fn x_step_index(&self) -> Option<usize> {
         self.x_step_index
     }
@@ -280,68 +327,48 @@ impl Operations {
         self.tuner_indices.clone()
     }
     
-    /// Set tune_rest value
-    pub fn set_tune_rest(&self, rest: f32) {
-        if let Ok(mut rest_val) = self.tune_rest.lock() {
-            *rest_val = rest;
-        }
-    }
-    
-    /// Get tune_rest value
-    pub fn get_tune_rest(&self) -> f32 {
-        self.tune_rest.lock()
-            .map(|r| *r)
-            .unwrap_or(10.0)
-    }
-    
-    /// Set x_rest value
-    pub fn set_x_rest(&self, rest: f32) {
-        if let Ok(mut rest_val) = self.x_rest.lock() {
-            *rest_val = rest;
-        }
-    }
-    
-    /// Get x_rest value
-    pub fn get_x_rest(&self) -> f32 {
-        self.x_rest.lock()
-            .map(|r| *r)
-            .unwrap_or(10.0)
-    }
-    
-    /// Set z_rest value
-    pub fn set_z_rest(&self, rest: f32) {
-        if let Ok(mut rest_val) = self.z_rest.lock() {
-            *rest_val = rest;
-        }
-    }
-    
-    /// Get z_rest value
-    pub fn get_z_rest(&self) -> f32 {
-        self.z_rest.lock()
-            .map(|r| *r)
-            .unwrap_or(5.0)
-    }
+    shared_param!(set_tune_rest, get_tune_rest, tune_rest, f32, 10.0);
+    shared_param!(set_x_rest, get_x_rest, x_rest, f32, 10.0);
+    shared_param!(set_z_rest, get_z_rest, z_rest, f32, 5.0);
 
-    fn sleep_for(seconds: f32) {
-        if seconds > 0.0 {
-            std::thread::sleep(Duration::from_secs_f32(seconds));
+    /// Sleep in short slices, returning early if the registered exit flag is
+    /// set. A Stop press is honored within one slice instead of after the
+    /// full rest interval (tune_rest alone defaults to several seconds).
+    fn sleep_for(&self, seconds: f32) {
+        if seconds <= 0.0 {
+            return;
+        }
+        let flag = self.exit_flag.lock().ok().and_then(|slot| slot.clone());
+        let deadline = std::time::Instant::now() + Duration::from_secs_f32(seconds);
+        const SLICE: Duration = Duration::from_millis(20);
+        loop {
+            if let Some(ref flag) = flag {
+                if flag.load(std::sync::atomic::Ordering::Relaxed) {
+                    return;
+                }
+            }
+            let now = std::time::Instant::now();
+            if now >= deadline {
+                return;
+            }
+            std::thread::sleep(SLICE.min(deadline - now));
         }
     }
 
     fn rest_z(&self) {
-        Self::sleep_for(self.get_z_rest());
+        self.sleep_for(self.get_z_rest());
     }
 
     fn rest_x(&self) {
-        Self::sleep_for(self.get_x_rest());
+        self.sleep_for(self.get_x_rest());
     }
 
     fn rest_tune(&self) {
-        Self::sleep_for(self.get_tune_rest());
+        self.sleep_for(self.get_tune_rest());
     }
 
     fn rest_lap(&self) {
-        Self::sleep_for(self.get_lap_rest());
+        self.sleep_for(self.get_lap_rest());
     }
 
     fn rel_move_z_with_rest<T: StepperOperations>(&self, stepper_ops: &mut T, stepper: usize, delta: i32, rest: bool) -> Result<()> {
@@ -372,132 +399,24 @@ impl Operations {
         Ok(())
     }
     
-    /// Set lap_rest value
-    pub fn set_lap_rest(&self, rest: f32) {
-        if let Ok(mut rest_val) = self.lap_rest.lock() {
-            *rest_val = rest;
-        }
-    }
-    
-    /// Get lap_rest value
-    pub fn get_lap_rest(&self) -> f32 {
-        self.lap_rest.lock()
-            .map(|r| *r)
-            .unwrap_or(4.0)
-    }
-    
-    /// Set adjustment_level value
-    pub fn set_adjustment_level(&self, level: i32) {
-        if let Ok(mut level_val) = self.adjustment_level.lock() {
-            *level_val = level;
-        }
-    }
-    
-    /// Get adjustment_level value
-    pub fn get_adjustment_level(&self) -> i32 {
-        self.adjustment_level.lock()
-            .map(|l| *l)
-            .unwrap_or(4)
-    }
-    
-    /// Set retry_threshold value
-    pub fn set_retry_threshold(&self, threshold: i32) {
-        if let Ok(mut thresh) = self.retry_threshold.lock() {
-            *thresh = threshold;
-        }
-    }
-    
-    /// Get retry_threshold value
-    pub fn get_retry_threshold(&self) -> i32 {
-        self.retry_threshold.lock()
-            .map(|t| *t)
-            .unwrap_or(50)
-    }
-    
-    /// Set delta_threshold value
-    pub fn set_delta_threshold(&self, threshold: i32) {
-        if let Ok(mut thresh) = self.delta_threshold.lock() {
-            *thresh = threshold;
-        }
-    }
-    
-    /// Get delta_threshold value
-    pub fn get_delta_threshold(&self) -> i32 {
-        self.delta_threshold.lock()
-            .map(|t| *t)
-            .unwrap_or(50)
-    }
-    
-    /// Set z_variance_threshold value
-    pub fn set_z_variance_threshold(&self, threshold: i32) {
-        if let Ok(mut thresh) = self.z_variance_threshold.lock() {
-            *thresh = threshold;
-        }
-    }
-    
-    /// Get z_variance_threshold value
-    pub fn get_z_variance_threshold(&self) -> i32 {
-        self.z_variance_threshold.lock()
-            .map(|t| *t)
-            .unwrap_or(50)
-    }
-    
-    /// Set x_start value
-    pub fn set_x_start(&self, start: i32) {
-        if let Ok(mut val) = self.x_start.lock() {
-            *val = start;
-        }
-    }
-    
-    /// Get x_start value
-    pub fn get_x_start(&self) -> i32 {
-        self.x_start.lock()
-            .map(|s| *s)
-            .unwrap_or(0)
-    }
-    
-    /// Set x_finish value
-    pub fn set_x_finish(&self, finish: i32) {
-        if let Ok(mut val) = self.x_finish.lock() {
-            *val = finish;
-        }
-    }
-    
-    /// Get x_finish value
-    pub fn get_x_finish(&self) -> i32 {
-        self.x_finish.lock()
-            .map(|f| *f)
-            .unwrap_or(100)
-    }
-    
-    /// Set x_step value
-    pub fn set_x_step(&self, step: i32) {
-        if let Ok(mut val) = self.x_step.lock() {
-            *val = step;
-        }
-    }
-    
-    /// Get x_step value
-    pub fn get_x_step(&self) -> i32 {
-        self.x_step.lock()
-            .map(|s| *s)
-            .unwrap_or(10)
-    }
+    shared_param!(set_lap_rest, get_lap_rest, lap_rest, f32, 4.0);
+    shared_param!(set_adjustment_level, get_adjustment_level, adjustment_level, i32, 4);
+    shared_param!(set_retry_threshold, get_retry_threshold, retry_threshold, i32, 50);
+    shared_param!(set_delta_threshold, get_delta_threshold, delta_threshold, i32, 50);
+    shared_param!(set_z_variance_threshold, get_z_variance_threshold, z_variance_threshold, i32, 50);
+    shared_param!(set_x_start, get_x_start, x_start, i32, 0);
+    shared_param!(set_x_finish, get_x_finish, x_finish, i32, 100);
+    shared_param!(set_x_step, get_x_step, x_step, i32, 10);
     
-    /// Get Z stepper indices based on configuration
+    /// Get Z stepper indices based on configuration (precomputed at init)
     pub fn get_z_stepper_indices(&self) -> Vec<usize> {
-        let mut indices = Vec::new();
-        for i in 0..(self.string_num * 2) {
-            let idx = self.z_first_index + i;
-            indices.push(idx);
-        }
-        indices
+        self.z_stepper_indices.clone()
     }
     
     /// Set stepper enable state
     pub fn set_stepper_enabled(&self, stepper_idx: usize, enabled: bool) {
         if let Ok(mut enabled_map) = self.stepper_enabled.lock() {
-            enabled_map.insert(stepper_idx, enabled);
+            Arc::make_mut(&mut enabled_map).insert(stepper_idx, enabled);
         }
     }
     
@@ -508,10 +427,10 @@ impl Operations {
             .unwrap_or(false)
     }
     
-    /// Get all stepper enabled states (clone of internal map)
-    pub fn get_all_stepper_enabled(&self) -> HashMap<usize, bool> {
+    /// Get all stepper enabled states (shared snapshot - no map copy)
+    pub fn get_all_stepper_enabled(&self) -> Arc<HashMap<usize, bool>> {
         self.stepper_enabled.lock()
-            .map(|map| map.clone())
+            .map(|map| Arc::clone(&map))
             .unwrap_or_default()
     }
     
@@ -654,9 +573,8 @@ impl Operations {
             // Use actual number of channels from audio data (not limited by string_num)
             let num_channels = partials.len();
             
-            // Use get_results functions for calculations
-            let voice_counts = calculate_voice_count(&partials);
-            let amp_sums = calculate_amp_sum(&partials);
+            // Single fused pass over the partials for both metrics
+            let (voice_counts, amp_sums) = calculate_voice_amp(&partials);
             
             // Update voice_count - resize to actual channel count, update all channels
             if let Ok(mut voice_count) = self.voice_count.lock() {
@@ -738,18 +656,12 @@ impl Operations {
                 return status;
             }
             
-            let z_indices = self.get_z_stepper_indices();
-            for &stepper_idx in &z_indices {
+            // One bulk read covers every Z sensor instead of a kernel call per stepper
+            let states = gpio.press_check(None).unwrap_or_default();
+            for &stepper_idx in &self.z_stepper_indices {
                 let gpio_index = stepper_idx.saturating_sub(self.z_first_index);
-                match gpio.press_check(Some(gpio_index)) {
-                    Ok(states) => {
-                        let is_bumping = states.get(0).copied().unwrap_or(false);
-                        status.push((stepper_idx, is_bumping));
-                    }
-                    Err(_) => {
-                        status.push((stepper_idx, false));
-                    }
-                }
+                let is_bumping = states.get(gpio_index).copied().unwrap_or(false);
+                status.push((stepper_idx, is_bumping));
             }
         }
         
@@ -789,13 +701,9 @@ impl Operations {
             ));
         }
 
-        // Get all Z-stepper indices
-        let mut all_z_indices = Vec::new();
-        for i in 0..(self.string_num * 2) {
-            let idx = self.z_first_index + i;
-            all_z_indices.push(idx);
-        }
-        
+        // Z-stepper indices are precomputed at init - no per-call rebuild
+        let all_z_indices = &self.z_stepper_indices;
+
         if all_z_indices.is_empty() {
             return Ok(String::new());
         }
@@ -816,6 +724,16 @@ impl Operations {
         const MAX_MOVE_ITERATIONS: u32 = 50;
         let mut messages = Vec::new();
 
+        // One bulk sensor read determines which steppers need clearing,
+        // instead of a kernel call per stepper
+        let initial_states = match gpio.press_check(None) {
+            Ok(states) => states,
+            Err(e) => {
+                messages.push(format!("GPIO error during bump_check: {}", e));
+                return Ok(messages.join("\n"));
+            }
+        };
+
         for &stepper_idx in &steppers_to_check {
             if let Some(exit) = exit_flag {
                 if exit.load(std::sync::atomic::Ordering::Relaxed) {
@@ -830,18 +748,9 @@ impl Operations {
 
             let gpio_index = stepper_idx.saturating_sub(self.z_first_index);
             let max_pos = max_positions.get(&stepper_idx).copied().unwrap_or(100);
-            
-            // Check initial bump state
-            let initial_bumping = match gpio.press_check(Some(gpio_index)) {
-                Ok(states) => states.get(0).copied().unwrap_or(false),
-                Err(e) => {
-                    messages.push(format!("GPIO error for stepper {}: {}", stepper_idx, e));
-                    continue; // Skip this stepper on GPIO error
-                }
-            };
 
             // If not bumping, skip this stepper
-            if !initial_bumping {
+            if !initial_states.get(gpio_index).copied().unwrap_or(false) {
                 continue;
             }
 
@@ -943,11 +852,11 @@ impl Operations {
             messages.push(bump_msg_initial);
         }
         
-        let z_indices = self.get_z_stepper_indices();
+        let z_indices = &self.z_stepper_indices;
         let enabled_states = self.get_all_stepper_enabled();
         let z_down_step = self.get_z_down_step();
         let mut original_positions = std::collections::HashMap::new();
-        for &idx in &z_indices {
+        for &idx in z_indices {
             if let Some(pos) = positions.get(idx).copied() {
                 original_positions.insert(idx, pos);
             }
@@ -955,91 +864,98 @@ impl Operations {
         
         messages.push("Starting Z calibration...".to_string());
         
-        // Calibrate each enabled Z-stepper
-        for &stepper_idx in &z_indices {
-            // Check exit flag
-            if let Some(exit) = exit_flag {
-                if exit.load(std::sync::atomic::Ordering::Relaxed) {
-                    messages.push("Calibration cancelled".to_string());
-                    return Ok(messages.join("\n"));
-                }
-            }
-            
+        // Calibrate all enabled Z-steppers concurrently: instead of walking
+        // each stepper to its sensor one at a time (paying z_rest per move
+        // per stepper), advance every active stepper one step per tick and
+        // settle once per tick. Total time becomes the slowest stepper's
+        // descent rather than the sum of all of them.
+        let min_pos = 0; // Default min_pos (could be made configurable)
+        let mut active: Vec<(usize, usize, i32)> = Vec::new(); // (stepper_idx, gpio_index, pos_local)
+
+        for &stepper_idx in z_indices {
             let enabled = enabled_states.get(&stepper_idx).copied().unwrap_or(false);
             if !enabled {
                 messages.push(format!("Skipping disabled stepper {}", stepper_idx));
                 continue;
             }
-            
+
             let gpio_index = stepper_idx.saturating_sub(self.z_first_index);
             let max_pos = max_positions.get(&stepper_idx).copied().unwrap_or(100);
-            let min_pos = 0; // Default min_pos (could be made configurable)
-            
+
             // Set position to max_pos without moving (like surfer.py's set_stepper)
             // This sets the Arduino's internal position counter without physical movement
             stepper_ops.reset(stepper_idx, max_pos)?;
             // Position is updated by refresh_positions() - Arduino is source of truth
-            
-            // Move down until sensor is touched
-            // Track position locally (like surfer.py's pos_local)
-            let mut pos_local = max_pos;
-            let mut touched = false;
-            
-            while !touched {
-                // Check exit flag
-                if let Some(exit) = exit_flag {
-                    if exit.load(std::sync::atomic::Ordering::Relaxed) {
-                        messages.push(format!("Calibration cancelled for stepper {}", stepper_idx));
-                        break;
-                    }
+
+            active.push((stepper_idx, gpio_index, max_pos));
+        }
+
+        let mut cancelled = false;
+        while !active.is_empty() {
+            // Check exit flag once per tick
+            if let Some(exit) = exit_flag {
+                if exit.load(std::sync::atomic::Ordering::Relaxed) {
+                    messages.push("Calibration cancelled".to_string());
+                    cancelled = true;
+                    break;
                 }
-                
+            }
+
+            let mut still_active = Vec::with_capacity(active.len());
+            for (stepper_idx, gpio_index, pos_local) in active {
                 // Check sensor BEFORE moving (surfer.py checks before move)
                 match gpio.press_check(Some(gpio_index)) {
                     Ok(states) => {
-                        if let Some(&is_touching) = states.get(0) {
-                            if is_touching {
-                                touched = true;
-                                break;
-                            }
+                        if states.get(0).copied().unwrap_or(false) {
+                            stepper_ops.reset(stepper_idx, 0)?;
+                            // Position is updated by refresh_positions() - Arduino is source of truth
+                            messages.push(format!("Stepper {} calibrated (touched sensor, reset to 0)", stepper_idx));
+                            continue;
                         }
                     }
                     Err(e) => {
                         messages.push(format!("GPIO error for stepper {}: {}", stepper_idx, e));
-                        break;
+                        messages.push(format!("Stepper {} calibration incomplete", stepper_idx));
+                        continue;
                     }
                 }
-                
+
                 // Check if we've hit minimum position BEFORE moving
                 if pos_local <= min_pos {
                     messages.push(format!("Stepper {} bottomed out during calibration (reached min_pos {} without touching) - disabling and leaving at current position", stepper_idx, min_pos));
                     // Disable the stepper since it can't reach the sensor
                     self.set_stepper_enabled(stepper_idx, false);
                     stepper_ops.disable(stepper_idx)?;
-                    break;
+                    messages.push(format!("Stepper {} calibration incomplete", stepper_idx));
+                    continue;
                 }
-                
+
                 // Move down (like surfer.py's rmove with down_step)
-                self.rel_move_z(stepper_ops, stepper_idx, z_down_step)?;
-                pos_local += z_down_step; // Update local position tracker (z_down_step is negative)
-                // Position is updated by refresh_positions() - Arduino is source of truth
-                
-                // Wait using z_rest timing (like surfer.py's waiter(config.ins.z_rest))
-                self.rest_z();
+                self.rel_move_z_no_rest(stepper_ops, stepper_idx, z_down_step)?;
+                // pos_local updated below (z_down_step is negative)
+                still_active.push((stepper_idx, gpio_index, pos_local + z_down_step));
             }
-            
-            if touched {
-                stepper_ops.reset(stepper_idx, 0)?;
-                // Position is updated by refresh_positions() - Arduino is source of truth
-                messages.push(format!("Stepper {} calibrated (touched sensor, reset to 0)", stepper_idx));
-            } else {
-                messages.push(format!("Stepper {} calibration incomplete", stepper_idx));
+            active = still_active;
+
+            // One shared settle per tick (like surfer.py's waiter(config.ins.z_rest)),
+            // instead of one per stepper per move. Edge-triggered: wakes as
+            // soon as any touch line fires rather than sleeping the full
+            // z_rest; the next tick's press_check confirms which stepper
+            // made contact.
+            if !active.is_empty() {
+                let z_rest = self.get_z_rest();
+                if z_rest > 0.0 {
+                    gpio.wait_z_touch(Duration::from_secs_f32(z_rest));
+                }
             }
         }
+        if cancelled {
+            return Ok(messages.join("\n"));
+        }
         
         // Summarize calibration offsets relative to starting positions
         let mut offset_summaries = Vec::new();
-        for &idx in &z_indices {
+        for &idx in z_indices {
             if let Some(orig) = original_positions.get(&idx) {
                 if let Some(current) = positions.get(idx).copied() {
                     let offset = orig - current;
@@ -1059,7 +975,7 @@ impl Operations {
         // Call bump_check to handle any steppers still touching after calibration
         messages.push("Running bump_check to clear any steppers still touching...".to_string());
         let mut max_positions_map = std::collections::HashMap::new();
-        for &stepper_idx in &z_indices {
+        for &stepper_idx in z_indices {
             max_positions_map.insert(stepper_idx, max_positions.get(&stepper_idx).copied().unwrap_or(100));
         }
         
@@ -1080,23 +996,20 @@ impl Operations {
                 exit_flag,
             )?;
             
-            // Check if any enabled steppers are still touching
+            // Check if any enabled steppers are still touching.
+            // One bulk probe covers every Z line, so the common all-clear
+            // case costs a single kernel call instead of one per stepper.
             let mut any_touching = false;
             let current_enabled_states = self.get_all_stepper_enabled();
-            for &stepper_idx in &z_indices {
-                let enabled = current_enabled_states.get(&stepper_idx).copied().unwrap_or(false);
-                if enabled {
-                    let gpio_index = stepper_idx.saturating_sub(self.z_first_index);
-                    match gpio.press_check(Some(gpio_index)) {
-                        Ok(states) => {
-                            if let Some(&is_touching) = states.get(0) {
-                                if is_touching {
-                                    any_touching = true;
-                                    break;
-                                }
-                            }
+            if let Ok(states) = gpio.press_check(None) {
+                for &stepper_idx in z_indices {
+                    let enabled = current_enabled_states.get(&stepper_idx).copied().unwrap_or(false);
+                    if enabled {
+                        let gpio_index = stepper_idx.saturating_sub(self.z_first_index);
+                        if states.get(gpio_index).copied().unwrap_or(false) {
+                            any_touching = true;
+                            break;
                         }
-                        Err(_) => {}
                     }
                 }
             }
@@ -1189,28 +1102,30 @@ impl Operations {
                 continue;
             }
             
-            let amp_sum = amp_sums[ch_idx];
-            let voice_count = voice_counts[ch_idx];
-            
-            let min_thresh = min_thresholds.get(ch_idx).copied().unwrap_or(20.0);
-            let max_thresh = max_thresholds.get(ch_idx).copied().unwrap_or(100.0);
-            let min_voice = min_voices.get(ch_idx).copied().unwrap_or(0);
-            let max_voice = max_voices.get(ch_idx).copied().unwrap_or(12);
-            
             // Determine which stepper to move (z_in or z_out)
             // Note: Assumes channel index maps to string index (1:1 mapping)
             // If channels != strings, this would need a mapping function
             let z_in_idx = self.z_first_index + (ch_idx * 2);
             let z_out_idx = self.z_first_index + (ch_idx * 2) + 1;
-            
+
             let z_in_enabled = enabled_states.get(&z_in_idx).copied().unwrap_or(false);
             let z_out_enabled = enabled_states.get(&z_out_idx).copied().unwrap_or(false);
-            
+
+            // Check enablement before any threshold work - no move can happen
+            // on a fully disabled pair regardless of the readings
             if !z_in_enabled && !z_out_enabled {
                 messages.push(format!("Channel {}: both steppers disabled, skipping", ch_idx));
                 continue;
             }
-            
+
+            let amp_sum = amp_sums[ch_idx];
+            let voice_count = voice_counts[ch_idx];
+
+            let min_thresh = min_thresholds.get(ch_idx).copied().unwrap_or(20.0);
+            let max_thresh = max_thresholds.get(ch_idx).copied().unwrap_or(100.0);
+            let min_voice = min_voices.get(ch_idx).copied().unwrap_or(0);
+            let max_voice = max_voices.get(ch_idx).copied().unwrap_or(12);
+
             // Check if adjustment is needed
             // Prioritize voice_count violations - they're more critical
             let voice_too_high = voice_count > max_voice;
@@ -1364,7 +1279,9 @@ impl Operations {
         messages.push(format!("X position after initial move: {}", current_x));
         let step_direction = if x_finish > x_start { 1 } else { -1 };
         let abs_step = x_step.abs();
-        
+        // Loop-invariant: direction and magnitude are fixed for the whole sweep
+        let step_delta = step_direction * abs_step;
+
         while (step_direction > 0 && current_x < x_finish) || (step_direction < 0 && current_x > x_finish) {
             // Check exit flag
             if let Some(exit) = exit_flag {
@@ -1399,23 +1316,11 @@ impl Operations {
                 let amp_deltas = calculate_amp_delta(&last_amp_sums, &current_amp_sums);
                 
                 // Determine which channels to skip (delta threshold exceeded)
-                let mut skip_channels = HashSet::new();
-                for (ch_idx, delta) in amp_deltas.iter().enumerate() {
-                    if *delta > delta_threshold {
-                        skip_channels.insert(ch_idx);
-                    }
-                }
+                let skip_channels = calculate_skip_channels(&amp_deltas, delta_threshold);
                 
                 // Calculate Z variance (sum of absolute differences in voice counts)
                 let voice_counts = self.get_voice_count();
-                let z_variance = if !last_voice_counts.is_empty() && last_voice_counts.len() == voice_counts.len() {
-                    voice_counts.iter()
-                        .zip(last_voice_counts.iter())
-                        .map(|(curr, last)| ((*curr as i32) - (*last as i32)).abs())
-                        .sum::<i32>()
-                } else {
-                    0
-                };
+                let z_variance = calculate_z_variance(&last_voice_counts, &voice_counts);
                 
                 // Per-loop message: Retries, Level, Delta per channel, Z variance
                 let delta_str = amp_deltas.iter()
@@ -1470,20 +1375,11 @@ impl Operations {
                 
                 // Check if all channels are within their min/max ranges (green indicators)
                 // A pass is when voice_count AND amp_sum for all channels are within their ranges
-                let num_channels = amp_sums.len().min(voice_counts.len());
-                let voice_amp_pass = (0..num_channels).all(|ch_idx| {
-                    let amp_sum = amp_sums[ch_idx];
-                    let voice_count = voice_counts[ch_idx];
-                    
-                    let min_thresh = min_thresholds.get(ch_idx).copied().unwrap_or(20.0);
-                    let max_thresh = max_thresholds.get(ch_idx).copied().unwrap_or(100.0);
-                    let min_voice = min_voices.get(ch_idx).copied().unwrap_or(0);
-                    let max_voice = max_voices.get(ch_idx).copied().unwrap_or(12);
-                    
-                    // Check both amp_sum and voice_count are within their ranges
-                    amp_sum >= min_thresh && amp_sum <= max_thresh &&
-                    voice_count >= min_voice && voice_count <= max_voice
-                });
+                let voice_amp_pass = voice_amp_within_limits(
+                    &voice_counts, &amp_sums,
+                    min_thresholds, max_thresholds,
+                    min_voices, max_voices,
+                );
                 
                 // A pass requires BOTH bump_check passed AND voice/amp checks passed
                 let all_pass = bump_check_passed && voice_amp_pass;
@@ -1498,7 +1394,6 @@ impl Operations {
                         messages.push(format!("Adjustment level {} met at X={} after {} attempts, moving X by step size {}", adjustment_level, current_x, attempts, abs_step));
                         
                         // Move X by exactly x_step_size (relative move)
-                        let step_delta = step_direction * abs_step;
                         self.rel_move_x(stepper_ops, x_step_index, step_delta)?;
                         // Position is updated by refresh_positions() - Arduino knows the position
                         // Read updated position from Arduino for next iteration - Arduino is source of truth
@@ -1622,7 +1517,9 @@ impl Operations {
         messages.push(format!("X position after initial move: {}", current_x));
         let step_direction = if x_start > x_finish { 1 } else { -1 };
         let abs_step = x_step.abs();
-        
+        // Loop-invariant: direction and magnitude are fixed for the whole sweep
+        let step_delta = step_direction * abs_step;
+
         while (step_direction > 0 && current_x < x_start) || (step_direction < 0 && current_x > x_start) {
             // Check exit flag
             if let Some(exit) = exit_flag {
@@ -1657,23 +1554,11 @@ impl Operations {
                 let amp_deltas = calculate_amp_delta(&last_amp_sums, &current_amp_sums);
                 
                 // Determine which channels to skip (delta threshold exceeded)
-                let mut skip_channels = HashSet::new();
-                for (ch_idx, delta) in amp_deltas.iter().enumerate() {
-                    if *delta > delta_threshold {
-                        skip_channels.insert(ch_idx);
-                    }
-                }
+                let skip_channels = calculate_skip_channels(&amp_deltas, delta_threshold);
                 
                 // Calculate Z variance (sum of absolute differences in voice counts)
                 let voice_counts = self.get_voice_count();
-                let z_variance = if !last_voice_counts.is_empty() && last_voice_counts.len() == voice_counts.len() {
-                    voice_counts.iter()
-                        .zip(last_voice_counts.iter())
-                        .map(|(curr, last)| ((*curr as i32) - (*last as i32)).abs())
-                        .sum::<i32>()
-                } else {
-                    0
-                };
+                let z_variance = calculate_z_variance(&last_voice_counts, &voice_counts);
                 
                 // Per-loop message: Retries, Level, Delta per channel, Z variance
                 let delta_str = amp_deltas.iter()
@@ -1728,20 +1613,11 @@ impl Operations {
                 
                 // Check if all channels are within their min/max ranges (green indicators)
                 // A pass is when voice_count AND amp_sum for all channels are within their ranges
-                let num_channels = amp_sums.len().min(voice_counts.len());
-                let voice_amp_pass = (0..num_channels).all(|ch_idx| {
-                    let amp_sum = amp_sums[ch_idx];
-                    let voice_count = voice_counts[ch_idx];
-                    
-                    let min_thresh = min_thresholds.get(ch_idx).copied().unwrap_or(20.0);
-                    let max_thresh = max_thresholds.get(ch_idx).copied().unwrap_or(100.0);
-                    let min_voice = min_voices.get(ch_idx).copied().unwrap_or(0);
-                    let max_voice = max_voices.get(ch_idx).copied().unwrap_or(12);
-                    
-                    // Check both amp_sum and voice_count are within their ranges
-                    amp_sum >= min_thresh && amp_sum <= max_thresh &&
-                    voice_count >= min_voice && voice_count <= max_voice
-                });
+                let voice_amp_pass = voice_amp_within_limits(
+                    &voice_counts, &amp_sums,
+                    min_thresholds, max_thresholds,
+                    min_voices, max_voices,
+                );
                 
                 // A pass requires BOTH bump_check passed AND voice/amp checks passed
                 let all_pass = bump_check_passed && voice_amp_pass;
@@ -1756,7 +1632,6 @@ impl Operations {
                         messages.push(format!("Adjustment level {} met at X={} after {} attempts, moving X by step size {}", adjustment_level, current_x, attempts, abs_step));
                         
                         // Move X by exactly x_step_size (relative move)
-                        let step_delta = step_direction * abs_step;
                         self.rel_move_x(stepper_ops, x_step_index, step_delta)?;
                         // Position is updated by refresh_positions() - Arduino knows the position
                         // Read updated position from Arduino for next iteration - Arduino is source of truth
@@ -1952,11 +1827,11 @@ impl Operations {
             // Home verified by GPIO - set X to 0
             stepper_ops.reset(x_step_index, 0)?;
             // Position is updated by refresh_positions() - Arduino is source of truth
-            messages.push(format!("X Home complete - position set to 0, verified at home"));
+            messages.push("X Home complete - position set to 0, verified at home".to_string());
         } else {
             // Never reached home - check if Arduino position is already 0
             if final_pos == 0 {
-                messages.push(format!("X Home failed - never reached home and Arduino position is already 0"));
+                messages.push("X Home failed - never reached home and Arduino position is already 0".to_string());
                 messages.push("Disabling X stepper due to home failure".to_string());
                 self.set_stepper_enabled(x_step_index, false);
                 stepper_ops.disable(x_step_index)?;